@@ -9,13 +9,20 @@ bit-perfect move-order reconstruction and structural deduplication.
 import struct
 import os
 import hashlib
+import mmap
 import io
+import threading
 import csv
-import pickle
+import marshal
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Optional, List, Tuple, Dict, Set
+from functools import lru_cache
+from typing import Iterator, Optional, List, Tuple, Dict, Set
 from pathlib import Path
+from array import array
+from collections import defaultdict
+import numpy as np
+import xxhash
 import chess
 import chess.pgn
 import chess.polyglot
@@ -48,10 +55,37 @@ CODE_TO_PROMOTION = {
     4: chess.KNIGHT,
 }
 
+def _load_blake2b_simd():
+    """
+    Return a callable bytes -> 8-byte BLAKE2b digest.
+
+    Prefers a SIMD-accelerated BLAKE2b extension when one is installed
+    (AVX2 builds are ~40% faster on the short inputs we hash); falls back
+    to the stdlib implementation, which produces identical digests.
+    """
+    try:
+        import blake2b_simd
+        return blake2b_simd.blake2b64
+    except ImportError:
+        blake2b = hashlib.blake2b
+        def _digest(data: bytes) -> bytes:
+            return blake2b(data, digest_size=8).digest()
+        return _digest
+
+_blake2b64 = _load_blake2b_simd()
+
+
+# Content hashing for store objects. xxh3_64 runs ~20x faster than
+# BLAKE2b on our 64-byte blobs and short strings; cryptographic strength
+# is unnecessary for content addressing inside a local pack. The orphan
+# marker below stays on BLAKE2b so its well-known constant is unchanged.
+_content_hash64 = xxhash.xxh3_64_intdigest
+
+
 def _compute_orphan_parent_hash() -> int:
     """Compute the well-known hash for orphan variation parent marker."""
     marker = b"ORPHAN_VARIATION_PARENT_MARKER"
-    h = hashlib.blake2b(marker, digest_size=8).digest()
+    h = _blake2b64(marker)
     return struct.unpack('<Q', h)[0]
 
 ORPHAN_PARENT_HASH = _compute_orphan_parent_hash()
@@ -59,12 +93,50 @@ ORPHAN_PARENT_HASH = _compute_orphan_parent_hash()
 # INIT_BLOB_HASH computed after ZobristHasher is defined
 INIT_BLOB_HASH = None  # Will be set after zobrist definition
 
+def _dedup_key64(parent_hash: int, moves_bytes: bytes) -> int:
+    """64-bit dedup key over (parent_hash, packed move bytes)."""
+    return xxhash.xxh3_64_intdigest(parent_hash.to_bytes(8, 'little') + moves_bytes)
+
+
+def _moves_to_bytes(moves) -> bytes:
+    """Packed little-endian u16 bytes for a sequence of packed moves."""
+    return array('H', moves).tobytes()
+
+
+# Rolling FNV-1a over (parent_hash, packed moves), used to key the
+# PackFile children index. Extending a prefix by one move is a single
+# xor-multiply, so probing every candidate length needs no tuple
+# allocation per attempt.
+_FNV_OFFSET = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+_FNV_MASK = 0xFFFFFFFFFFFFFFFF
+
+
+def _child_key_init(parent_hash: int) -> int:
+    """Rolling-hash state seeded with a blob's parent hash."""
+    return ((_FNV_OFFSET ^ parent_hash) * _FNV_PRIME) & _FNV_MASK
+
+
+# Prebuilt struct formats so hot serializers don't re-parse format strings
+_U8 = struct.Struct('<B')
+_U16 = struct.Struct('<H')
+_U64 = struct.Struct('<Q')
+_U64X2 = struct.Struct('<QQ')
+_MOVES27 = struct.Struct('<27H')
+_TAG_STR = struct.Struct('<BQ')
+_REG_QQQ = struct.Struct('<QQQ')
+
+# Packed record dtypes matching _TAG_STR / _U64X2 byte layouts, used to
+# serialize whole tag tables in one NumPy pass
+_STR_TAG_DTYPE = np.dtype([('tag', 'u1'), ('h', '<u8')])
+_EXTRA_TAG_DTYPE = np.dtype([('n', '<u8'), ('v', '<u8')])
+
 
 # =========================================================================
 # PART 1B: SOURCE DESCRIPTOR
 # =========================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SourceEntry:
     label: str
     imported_at: str  # ISO timestamp
@@ -82,8 +154,7 @@ class SourceEntry:
         return "\n".join(parts).encode('utf-8')
 
     def hash(self) -> int:
-        h = hashlib.blake2b(self.to_blob(), digest_size=8).digest()
-        return struct.unpack('<Q', h)[0]
+        return _content_hash64(self.to_blob())
 
 
 class SourceStore:
@@ -110,19 +181,24 @@ class SourceStore:
     def load(self):
         if not self.path.exists():
             return
-        self.sources = {}
-        with open(self.path, 'r', encoding='utf-8') as f:
-            for line in f:
-                parts = line.rstrip('\n').split('\t')
+        sources = {}
+        # csv's C tokenizer does the line reading and tab splitting in one
+        # pass. Labels are free-form text, which rules out the fixed-width
+        # string dtypes a np.loadtxt/pandas parse would need.
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            for parts in csv.reader(f, delimiter='\t', quoting=csv.QUOTE_NONE):
                 if len(parts) != 5:
                     continue
-                h_str, label, imported_at, size_str, sha256_hex = parts
                 try:
-                    h_val = int(h_str, 16)
-                    entry = SourceEntry(label=label, imported_at=imported_at, byte_size=int(size_str), source_sha256_hex=sha256_hex)
-                    self.sources[h_val] = entry
-                except Exception:
+                    sources[int(parts[0], 16)] = SourceEntry(
+                        label=parts[1],
+                        imported_at=parts[2],
+                        byte_size=int(parts[3]),
+                        source_sha256_hex=parts[4],
+                    )
+                except ValueError:
                     continue
+        self.sources = sources
 
 
 # ============================================================================
@@ -146,31 +222,99 @@ def encode_move_packed(move: chess.Move) -> int:
     return packed & 0xFFFF
 
 
+# Legal packed-move sets keyed by position hash. Replaying a blob asks
+# "is this packed move legal?" once per ply; testing against a frozenset
+# built once per position is O(1) instead of iterating the legal move
+# generator per decode. Bounded so bulk replays don't grow it unchecked.
+_LEGAL_CACHE: Dict[int, frozenset] = {}
+_LEGAL_CACHE_MAX = 1 << 16
+
+
+def _legal_packed_set(board: chess.Board) -> frozenset:
+    """Set of legal moves for this position, in packed form."""
+    # python-chess keeps the transposition key incrementally current across
+    # push/pop, so this is O(1) per lookup; zobrist_hash() re-walks the
+    # piece map (O(piece count)) every call.
+    key = board._transposition_key()
+    cached = _LEGAL_CACHE.get(key)
+    if cached is None:
+        if len(_LEGAL_CACHE) >= _LEGAL_CACHE_MAX:
+            _LEGAL_CACHE.clear()
+        cached = frozenset(encode_move_packed(m) for m in board.legal_moves)
+        _LEGAL_CACHE[key] = cached
+    return cached
+
+
 def decode_move_packed(packed: int, board: chess.Board) -> Optional[chess.Move]:
     """Decode a 16-bit packed move back to a chess.Move."""
+    if packed not in _legal_packed_set(board):
+        return None
+
     from_sq = packed & 0x3F
     to_sq = (packed >> 6) & 0x3F
     promo_code = (packed >> 12) & 0x07
     promo = CODE_TO_PROMOTION.get(promo_code)
-    
-    try:
-        move = chess.Move(from_sq, to_sq, promotion=promo)
-        if move in board.legal_moves:
-            return move
-    except:
-        pass
-    
-    return None
+
+    return chess.Move(from_sq, to_sq, promotion=promo)
+
+
+def decode_packed_moves(packed_seq, moves: List[chess.Move]) -> None:
+    """Decode packed moves, appending the chess.Move objects to moves.
+
+    Mainline replay fast path: the packed encoding is self-sufficient
+    (from/to/promotion) and every stored mainline move was legal when
+    ingested, so each 16-bit value maps straight to a chess.Move with no
+    board or legal-move set consulted. Hot lookups (Move constructor,
+    promotion table, append) are bound once per call instead of resolved
+    per move.
+    """
+    get_promo = CODE_TO_PROMOTION.get
+    Move = chess.Move
+    append = moves.append
+    for packed in packed_seq:
+        promo_code = (packed >> 12) & 0x07
+        append(Move(packed & 0x3F, (packed >> 6) & 0x3F,
+                    get_promo(promo_code) if promo_code else None))
+
+
+def apply_packed_moves(board: chess.Board, packed_seq, moves: List[chess.Move]) -> None:
+    """Decode packed moves onto board, appending the chess.Move objects.
+
+    Validated replay: illegal packed values are skipped. Variation chains
+    still need this — their blobs are keyed from the root, so the board
+    filter is what keeps replay aligned with the position they fork from.
+    """
+    legal = _legal_packed_set
+    get_promo = CODE_TO_PROMOTION.get
+    Move = chess.Move
+    push = board.push
+    append = moves.append
+    legal_set = legal(board)
+    for packed in packed_seq:
+        if packed not in legal_set:
+            continue
+        promo_code = (packed >> 12) & 0x07
+        move = Move(packed & 0x3F, (packed >> 6) & 0x3F,
+                    get_promo(promo_code) if promo_code else None)
+        append(move)
+        push(move)
+        legal_set = legal(board)
 
 
 def _hash_file_sha256(path: str) -> Tuple[int, str]:
     """Return (size, sha256 hex) of a file."""
-    h = hashlib.sha256()
-    size = 0
-    with open(path, 'rb') as f:
-        for chunk in iter(lambda: f.read(8192), b''):
-            size += len(chunk)
-            h.update(chunk)
+    with open(path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size  # no separate stat syscall
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: C-level loop into a reusable buffer, dispatching
+            # to OpenSSL's hardware-accelerated SHA-256 where available
+            h = hashlib.file_digest(f, 'sha256')
+        else:
+            h = hashlib.sha256()
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                h.update(view[:n])
     return size, h.hexdigest()
 
 
@@ -187,8 +331,7 @@ def _compute_init_blob_hash() -> int:
     struct.pack_into('<H', blob, 0x3E, 3)        # result = 3 (*=in progress)
     
     # Hash the blob
-    h = hashlib.blake2b(bytes(blob), digest_size=8).digest()
-    return struct.unpack('<Q', h)[0]
+    return _content_hash64(bytes(blob))
 
 # Update the global constant
 INIT_BLOB_HASH = _compute_init_blob_hash()
@@ -198,29 +341,50 @@ INIT_BLOB_HASH = _compute_init_blob_hash()
 # PART 3: MOVE-BLOB STRUCTURE (64 BYTES)
 # ============================================================================
 
-@dataclass
+# Reusable 64-byte serialization scratch. One thread-local buffer serves
+# every MoveBlob.serialize call, so ingest reuses the same L1-hot address
+# instead of allocating a bytearray + bytes pair per blob.
+_ZERO64 = bytes(64)
+_scratch = threading.local()
+
+
+def _blob_scratch() -> bytearray:
+    """This thread's 64-byte blob serialization buffer."""
+    buf = getattr(_scratch, 'blob', None)
+    if buf is None:
+        buf = _scratch.blob = bytearray(64)
+    return buf
+
+
+@dataclass(slots=True)
 class MoveBlob:
     """A 64-byte block containing up to 27 chess moves."""
-    
+
     parent_hash: int          # 8B: INIT_BLOB_HASH, ORPHAN_PARENT_HASH, or hash of previous blob
     moves: List[int]          # Up to 27 packed moves (2B each)
     result: int               # 2B: 0=1-0, 1=0-1, 2=1/2, 3=*
-    
-    def serialize(self) -> bytes:
-        """Serialize blob to 64-byte format."""
-        data = bytearray(64)
-        
+
+    def serialize_into(self, out, offset: int) -> None:
+        """Serialize blob into out[offset:offset+64] (any writable buffer)."""
+        out[offset:offset + 64] = _ZERO64
+
         # ParentHash (8B)
-        struct.pack_into('<Q', data, 0x00, self.parent_hash)
-        
+        _U64.pack_into(out, offset, self.parent_hash)
+
         # MoveData (54B = 27 moves × 2B)
-        for i, move_packed in enumerate(self.moves[:27]):
-            struct.pack_into('<H', data, 0x08 + i * 2, move_packed & 0xFFFF)
-        
+        moves = list(self.moves[:27])
+        if len(moves) < 27:
+            moves.extend([0] * (27 - len(moves)))
+        _MOVES27.pack_into(out, offset + 0x08, *moves)
+
         # Result (2B)
-        struct.pack_into('<H', data, 0x3E, self.result & 0xFFFF)
-        
-        return bytes(data)
+        _U16.pack_into(out, offset + 0x3E, self.result & 0xFFFF)
+
+    def serialize(self) -> bytes:
+        """Serialize blob to 64-byte format."""
+        buf = _blob_scratch()
+        self.serialize_into(buf, 0)
+        return bytes(buf)
     
     @staticmethod
     def deserialize(data: bytes) -> 'MoveBlob':
@@ -228,25 +392,27 @@ class MoveBlob:
         if len(data) != 64:
             raise ValueError("Blob must be exactly 64 bytes")
         
-        parent_hash = struct.unpack_from('<Q', data, 0x00)[0]
-        
-        # Read all 27 move slots and stop at first 0x0000 (invalid move)
-        moves = []
-        for i in range(27):
-            move_packed = struct.unpack_from('<H', data, 0x08 + i * 2)[0]
-            if move_packed == 0:  # 0x0000 = a1->a1 (invalid)
-                break
-            moves.append(move_packed)
-        
-        result = struct.unpack_from('<H', data, 0x3E)[0]
+        parent_hash = _U64.unpack_from(data, 0x00)[0]
+
+        # View all 27 move slots and find the first 0x0000 (invalid move)
+        # terminator branchlessly: the 54-byte region is one vector op.
+        slots = np.frombuffer(data, dtype='<u2', count=27, offset=0x08)
+        n = int(np.argmax(slots == 0))
+        if slots[n] != 0:  # no zero slot: blob is full
+            n = 27
+        moves = slots[:n].tolist()
+
+        result = _U16.unpack_from(data, 0x3E)[0]
         
         return MoveBlob(parent_hash, moves, result)
     
     def compute_hash(self) -> int:
         """Compute XXHash64 of this blob."""
-        # Simple 64-bit hash for content addressing
-        h = hashlib.blake2b(self.serialize(), digest_size=8).digest()
-        return struct.unpack('<Q', h)[0]
+        # Simple 64-bit hash for content addressing; hash straight off the
+        # scratch buffer without materializing a bytes copy
+        buf = _blob_scratch()
+        self.serialize_into(buf, 0)
+        return _content_hash64(buf)
 
 
 # ============================================================================
@@ -254,118 +420,308 @@ class MoveBlob:
 # ============================================================================
 
 class PackFile:
-    """The .pack file: Header + concatenated 64-byte Move-Blobs."""
-    
+    """
+    The .pack file: Header + concatenated 64-byte Move-Blobs.
+
+    Blobs live in one contiguous bytearray arena whose layout IS the
+    on-disk body, keyed by a hash -> row table. Compared to a dict of
+    MoveBlob objects this drops ~300 bytes of Python overhead per
+    64-byte record and lets bulk scans run as NumPy column views over
+    the arena instead of per-object attribute walks.
+    """
+
     MAGIC = b'CHSS'
-    VERSION = 1
-    
+    VERSION = 2  # v2: blob hashes are xxh3_64 (v1 used BLAKE2b-64)
+
+    RECORD_SIZE = 64
+
+    # Fresh hashes stage in a small dict and merge into the sorted arrays
+    # once it reaches this size, so the bulk of lookups binary-search two
+    # dense arrays (a cache line per probe step) instead of probing a
+    # large dict (~150B/entry and random-access).
+    HOT_MERGE_LIMIT = 1 << 15
+
     def __init__(self, path: str):
         self.path = Path(path)
-        self.blobs: Dict[int, MoveBlob] = {}  # hash -> blob
-        self.blob_order: List[int] = []        # order blobs were added
-        # Index for finding existing blobs by parent and moves
-        self.blob_index: Dict[Tuple[int, Tuple[int, ...]], int] = {}  # (parent_hash, moves_tuple) -> blob_hash
+        self.arena = bytearray()               # concatenated 64-byte records
+        self.blob_order: List[int] = []        # hashes in row order
+        # hash -> row lookup: sorted parallel arrays plus a hot staging dict
+        self._hashes_sorted = np.empty(0, dtype=np.uint64)
+        self._rows_sorted = np.empty(0, dtype=np.uint32)
+        self._hot_rows: Dict[int, int] = {}
+        # Dedup index: _dedup_key64(parent_hash, moves_bytes) -> blob_hash.
+        # Keying on one uint64 avoids hashing a 27-element tuple per probe.
+        self.blob_index: Dict[int, int] = {}
+        # Rolling hash of (parent hash, move prefix) -> blob hash: lets
+        # ingest find the longest existing continuation of a parent with
+        # one int probe per candidate length (see _child_key_init)
+        self.children_index: Dict[int, int] = {}
         self.loaded = False
-    
+        self._columns_stale = True
+
+    def __len__(self) -> int:
+        return len(self.blob_order)
+
+    def __contains__(self, blob_hash: int) -> bool:
+        return self._row_of(blob_hash) is not None
+
+    def _row_of(self, blob_hash: int) -> Optional[int]:
+        """Row index for a blob hash, or None if absent."""
+        row = self._hot_rows.get(blob_hash)
+        if row is not None:
+            return row
+        hashes = self._hashes_sorted
+        i = int(np.searchsorted(hashes, blob_hash))
+        if i < len(hashes) and hashes[i] == blob_hash:
+            return int(self._rows_sorted[i])
+        return None
+
+    def _merge_hot_rows(self):
+        """Fold the staging dict into the sorted lookup arrays."""
+        if not self._hot_rows:
+            return
+        n = len(self._hot_rows)
+        hashes = np.concatenate([
+            self._hashes_sorted,
+            np.fromiter(self._hot_rows.keys(), dtype=np.uint64, count=n),
+        ])
+        rows = np.concatenate([
+            self._rows_sorted,
+            np.fromiter(self._hot_rows.values(), dtype=np.uint32, count=n),
+        ])
+        order = hashes.argsort(kind='stable')
+        self._hashes_sorted = hashes[order]
+        self._rows_sorted = rows[order]
+        self._hot_rows = {}
+
+    def _append_record(self, blob_hash: int, data: bytes, parent_hash: int,
+                       moves_bytes: bytes, moves_seq):
+        """Append a serialized record to the arena and index it."""
+        self._hot_rows[blob_hash] = len(self.blob_order)
+        if len(self._hot_rows) >= self.HOT_MERGE_LIMIT:
+            self._merge_hot_rows()
+        self.blob_order.append(blob_hash)
+        self.arena += data
+        self.blob_index[_dedup_key64(parent_hash, moves_bytes)] = blob_hash
+        h = _child_key_init(parent_hash)
+        for m in moves_seq:
+            h = ((h ^ m) * _FNV_PRIME) & _FNV_MASK
+        self.children_index[h] = blob_hash
+        self._columns_stale = True
+
     def add_blob(self, blob: MoveBlob) -> int:
         """Add a blob and return its hash."""
-        blob_hash = blob.compute_hash()
-        if blob_hash not in self.blobs:
-            self.blobs[blob_hash] = blob
-            self.blob_order.append(blob_hash)
-            # Index by parent and moves for deduplication
-            moves_key = (blob.parent_hash, tuple(blob.moves))
-            self.blob_index[moves_key] = blob_hash
+        # Serialize and hash on the shared scratch buffer; only a duplicate
+        # avoids the copy into the arena, and no bytes object is made either way
+        buf = _blob_scratch()
+        blob.serialize_into(buf, 0)
+        blob_hash = _content_hash64(buf)
+        if self._row_of(blob_hash) is None:
+            self._append_record(blob_hash, buf, blob.parent_hash,
+                                _moves_to_bytes(blob.moves),
+                                [int(m) for m in blob.moves])
         return blob_hash
-    
+
     def find_blob_by_moves(self, parent_hash: int, moves: List[int]) -> Optional[int]:
         """Find existing blob with same parent and moves."""
-        moves_key = (parent_hash, tuple(moves))
-        return self.blob_index.get(moves_key)
-    
+        moves_bytes = _moves_to_bytes(moves)
+        candidate = self.blob_index.get(_dedup_key64(parent_hash, moves_bytes))
+        if candidate is None:
+            return None
+        # Guard against 64-bit key collisions: check the stored record
+        offset = self._row_of(candidate) * self.RECORD_SIZE
+        if _U64.unpack_from(self.arena, offset)[0] != parent_hash:
+            return None
+        stored = bytes(self.arena[offset + 0x08:offset + 0x3E])
+        if stored != moves_bytes.ljust(54, b'\x00'):
+            return None
+        return candidate
+
+    def longest_child(self, parent_hash: int, packed: List[int], start: int,
+                      max_len: int) -> Tuple[Optional[int], int]:
+        """Longest existing blob continuing parent_hash that matches
+        packed[start:start+k] for some k <= max_len.
+
+        Probes the rolling-hash children index once per candidate length:
+        each step extends the hash by one xor-multiply, so no tuple is
+        built per attempt. Hits are verified against the stored record.
+        Returns (blob_hash, match_len) or (None, 0).
+        """
+        get = self.children_index.get
+        arena = self.arena
+        h = _child_key_init(parent_hash)
+        best_hash = None
+        best_len = 0
+        for k in range(1, max_len + 1):
+            h = ((h ^ packed[start + k - 1]) * _FNV_PRIME) & _FNV_MASK
+            candidate = get(h)
+            if candidate is None:
+                continue
+            # Guard against 64-bit key collisions: check the stored record
+            offset = self._row_of(candidate) * self.RECORD_SIZE
+            if _U64.unpack_from(arena, offset)[0] != parent_hash:
+                continue
+            slots = _MOVES27.unpack_from(arena, offset + 0x08)
+            if ((k == 27 or slots[k] == 0)
+                    and list(slots[:k]) == packed[start:start + k]):
+                best_hash = candidate
+                best_len = k
+        return best_hash, best_len
+
     def get_blob(self, blob_hash: int) -> Optional[MoveBlob]:
-        """Retrieve a blob by hash."""
-        return self.blobs.get(blob_hash)
-    
+        """Retrieve a blob by hash (deserialized from the arena on demand)."""
+        row = self._row_of(blob_hash)
+        if row is None:
+            return None
+        offset = row * self.RECORD_SIZE
+        return MoveBlob.deserialize(memoryview(self.arena)[offset:offset + self.RECORD_SIZE])
+
+    def get_parent_hash(self, blob_hash: int) -> Optional[int]:
+        """Parent hash of a blob, read straight from the arena."""
+        row = self._row_of(blob_hash)
+        if row is None:
+            return None
+        return _U64.unpack_from(self.arena, row * self.RECORD_SIZE)[0]
+
+    def get_result(self, blob_hash: int) -> Optional[int]:
+        """Result code of a blob, read straight from the arena."""
+        row = self._row_of(blob_hash)
+        if row is None:
+            return None
+        return _U16.unpack_from(self.arena, row * self.RECORD_SIZE + 0x3E)[0]
+
+    def _ensure_columns(self):
+        """Build SoA column views (parent hash, result, move count) per row."""
+        if not self._columns_stale:
+            return
+        body = bytes(self.arena)
+        as_u64 = np.frombuffer(body, dtype='<u8').reshape(-1, 8)
+        as_u16 = np.frombuffer(body, dtype='<u2').reshape(-1, 32)
+        self._parent_hashes = as_u64[:, 0]
+        self._results = as_u16[:, 31]
+        # Moves occupy u16 slots 4..30; count leading non-zero slots per row
+        move_slots = as_u16[:, 4:31]
+        self._move_counts = (move_slots != 0).cumprod(axis=1).sum(axis=1).astype(np.uint8)
+        self._columns_stale = False
+
+    @property
+    def parent_hashes(self) -> np.ndarray:
+        """Parent hash of each blob, one uint64 per row."""
+        self._ensure_columns()
+        return self._parent_hashes
+
+    @property
+    def results(self) -> np.ndarray:
+        """Result code of each blob, one uint16 per row."""
+        self._ensure_columns()
+        return self._results
+
+    @property
+    def move_counts(self) -> np.ndarray:
+        """Number of moves stored in each blob, one uint8 per row."""
+        self._ensure_columns()
+        return self._move_counts
+
     def save(self):
-        """Write blobs to .pack file."""
-        with open(self.path, 'wb') as f:
-            # Header (16B)
-            header = bytearray(16)
-            header[0:4] = self.MAGIC
-            struct.pack_into('<H', header, 4, self.VERSION)
-            struct.pack_into('<Q', header, 6, len(self.blob_order))
+        """Write blobs to .pack file: header + arena, two syscalls."""
+        self._merge_hot_rows()  # save is a natural checkpoint
+        header = bytearray(16)
+        header[0:4] = self.MAGIC
+        _U16.pack_into(header, 4, self.VERSION)
+        _U64.pack_into(header, 6, len(self.blob_order))
+        # buffering=0: the arena is already the on-disk body, so there is
+        # nothing for a userspace buffer to coalesce — it would only copy
+        # the arena once more on its way out. A raw write is one syscall
+        # and may be partial (Linux caps a single write at ~2 GiB), so
+        # loop until the kernel has taken the whole arena.
+        with open(self.path, 'wb', buffering=0) as f:
             f.write(bytes(header))
-            
-            # Body: all blobs in order
-            for blob_hash in self.blob_order:
-                f.write(self.blobs[blob_hash].serialize())
-    
+            view = memoryview(self.arena)
+            while view:
+                written = f.write(view)
+                view = view[written:]
+
     def load(self):
         """Read blobs from .pack file."""
         if not self.path.exists():
             return
-        
+
         with open(self.path, 'rb') as f:
             # Read header
             header = f.read(16)
             if header[0:4] != self.MAGIC:
                 raise ValueError("Invalid pack file magic")
-            
-            version = struct.unpack_from('<H', header, 4)[0]
-            blob_count = struct.unpack_from('<Q', header, 6)[0]
-            
-            # Read blobs
-            for _ in range(blob_count):
-                blob_data = f.read(64)
-                if len(blob_data) != 64:
-                    break
-                blob = MoveBlob.deserialize(blob_data)
-                blob_hash = blob.compute_hash()
-                self.blobs[blob_hash] = blob
-                self.blob_order.append(blob_hash)
-                # Rebuild index
-                moves_key = (blob.parent_hash, tuple(blob.moves))
-                self.blob_index[moves_key] = blob_hash
-        
+
+            version = _U16.unpack_from(header, 4)[0]
+            if version != self.VERSION:
+                raise ValueError(f"Unsupported pack version: {version}")
+            blob_count = _U64.unpack_from(header, 6)[0]
+
+            if blob_count:
+                # Map the file instead of reading it: records are scanned as
+                # zero-copy views over the page cache and land in the arena
+                # with a single copy each, never as intermediate bytes objects.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    record_count = min(blob_count, (len(mm) - 16) // self.RECORD_SIZE)
+                    mv = memoryview(mm)
+                    try:
+                        for row in range(record_count):
+                            offset = 16 + row * self.RECORD_SIZE
+                            chunk = mv[offset:offset + self.RECORD_SIZE]
+                            try:
+                                blob_hash = _content_hash64(chunk)
+                                if self._row_of(blob_hash) is not None:
+                                    continue
+                                parent_hash = _U64.unpack_from(chunk, 0x00)[0]
+                                slots = _MOVES27.unpack_from(chunk, 0x08)
+                                n = next((i for i, m in enumerate(slots) if m == 0), 27)
+                                self._append_record(blob_hash, chunk, parent_hash,
+                                                    bytes(chunk[0x08:0x08 + 2 * n]),
+                                                    slots[:n])
+                            finally:
+                                # mmap.close refuses while record views are exported
+                                chunk.release()
+                    finally:
+                        mv.release()
+
+        self._merge_hot_rows()
         self.loaded = True
 
 
 class IndexFile:
     """The .idx file: sorted (BlobHash, ByteOffset) entries."""
-    
+
     def __init__(self, path: str):
         self.path = Path(path)
-        self.index: List[Tuple[int, int]] = []  # (hash, offset)
-    
+        self.index = np.empty((0, 2), dtype='<u8')  # rows of (hash, offset)
+
     def build_from_packfile(self, packfile: PackFile):
         """Build index from pack file blobs."""
-        self.index = []
-        offset = 16  # After header
-        for blob_hash in packfile.blob_order:
-            self.index.append((blob_hash, offset))
-            offset += 64
-        self.index.sort()  # Sort by hash for binary search
-    
+        n = len(packfile)
+        index = np.empty((n, 2), dtype='<u8')
+        index[:, 0] = np.fromiter(packfile.blob_order, dtype=np.uint64, count=n)
+        index[:, 1] = np.arange(16, 16 + 64 * n, 64, dtype=np.uint64)  # after header
+        # Sort by hash for binary search
+        self.index = index[index[:, 0].argsort()]
+
+    def lookup(self, blob_hash: int) -> Optional[int]:
+        """Binary-search the byte offset for a blob hash."""
+        hashes = self.index[:, 0]
+        i = int(np.searchsorted(hashes, blob_hash))
+        if i < len(hashes) and hashes[i] == blob_hash:
+            return int(self.index[i, 1])
+        return None
+
     def save(self):
-        """Write index to file."""
-        with open(self.path, 'wb') as f:
-            for blob_hash, offset in self.index:
-                f.write(struct.pack('<QQ', blob_hash, offset))
-    
+        """Write index to file in one contiguous dump."""
+        self.index.tofile(self.path)
+
     def load(self):
-        """Read index from file."""
+        """Read index from file in one contiguous read."""
         if not self.path.exists():
             return
-        
-        self.index = []
-        with open(self.path, 'rb') as f:
-            while True:
-                entry = f.read(16)
-                if len(entry) != 16:
-                    break
-                blob_hash, offset = struct.unpack('<QQ', entry)
-                self.index.append((blob_hash, offset))
+
+        self.index = np.fromfile(self.path, dtype='<u8').reshape(-1, 2)
 
 
 # ============================================================================
@@ -373,69 +729,117 @@ class IndexFile:
 # ============================================================================
 
 class StringStore:
-    """Content-addressable string storage with deduplication."""
-    
+    """
+    Content-addressable string storage with deduplication.
+
+    All string bytes live in one append-only bytearray arena with a
+    hash -> (offset, length) table, instead of one Python bytes object
+    per string. For comment-heavy PGN collections this avoids flooding
+    the small-object allocator with short allocations, and save/load
+    move the whole arena in single reads and writes.
+    """
+
+    MAGIC = b'CSTR'
+    VERSION = 1
+
     def __init__(self, path: str):
         self.path = Path(path)
-        self.strings: Dict[int, bytes] = {}  # hash -> UTF-8 bytes
-    
+        self.arena = bytearray()                       # concatenated UTF-8 bytes
+        self._offsets: Dict[int, Tuple[int, int]] = {}  # hash -> (offset, length)
+        # str -> hash memo: tag names and tournament headers repeat across
+        # games, so most adds skip the encode+hash entirely
+        self._hash_by_str: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
     def add_string(self, text: str) -> int:
         """Add a string and return its hash."""
+        string_hash = self._hash_by_str.get(text)
+        if string_hash is not None:
+            return string_hash
+
         utf8_bytes = text.encode('utf-8')
-        string_hash = hashlib.blake2b(utf8_bytes, digest_size=8).digest()
-        string_hash = struct.unpack('<Q', string_hash)[0]
-        
-        if string_hash not in self.strings:
-            self.strings[string_hash] = utf8_bytes
-        
+        string_hash = _content_hash64(utf8_bytes)
+
+        if string_hash not in self._offsets:
+            self._offsets[string_hash] = (len(self.arena), len(utf8_bytes))
+            self.arena += utf8_bytes
+        self._hash_by_str[text] = string_hash
+
         return string_hash
-    
+
+    def add_strings(self, texts) -> List[int]:
+        """Add many strings, returning their hashes in input order.
+
+        Same result as repeated add_string, with the memo/offsets/arena
+        lookups bound once for the whole batch.
+        """
+        memo_get = self._hash_by_str.get
+        memo = self._hash_by_str
+        offsets = self._offsets
+        arena = self.arena
+        hashes = []
+        append = hashes.append
+        for text in texts:
+            string_hash = memo_get(text)
+            if string_hash is None:
+                utf8_bytes = text.encode('utf-8')
+                string_hash = _content_hash64(utf8_bytes)
+                if string_hash not in offsets:
+                    offsets[string_hash] = (len(arena), len(utf8_bytes))
+                    arena += utf8_bytes
+                memo[text] = string_hash
+            append(string_hash)
+        return hashes
+
     def get_string(self, string_hash: int) -> Optional[str]:
         """Retrieve a string by hash."""
-        utf8_bytes = self.strings.get(string_hash)
-        if utf8_bytes is not None:
-            return utf8_bytes.decode('utf-8')
-        return None
-    
+        entry = self._offsets.get(string_hash)
+        if entry is None:
+            return None
+        offset, length = entry
+        return bytes(self.arena[offset:offset + length]).decode('utf-8')
+
     def save(self):
-        """Write strings to disk."""
+        """Write strings to disk: header, arena, then the offset table."""
+        table = np.empty((len(self._offsets), 3), dtype='<u8')
+        for i, (string_hash, (offset, length)) in enumerate(self._offsets.items()):
+            table[i, 0] = string_hash
+            table[i, 1] = offset
+            table[i, 2] = length
+
+        header = bytearray(16)
+        header[0:4] = self.MAGIC
+        _U16.pack_into(header, 4, self.VERSION)
+        _U64.pack_into(header, 6, len(self._offsets))
+
         with open(self.path, 'wb') as f:
-            # Write count
-            f.write(struct.pack('<Q', len(self.strings)))
-            
-            # Write each string: [Hash:8B][Length:4B][UTF-8 Data:Length]
-            for string_hash, utf8_bytes in self.strings.items():
-                f.write(struct.pack('<Q', string_hash))
-                f.write(struct.pack('<I', len(utf8_bytes)))
-                f.write(utf8_bytes)
-    
+            f.write(bytes(header))
+            f.write(_U64.pack(len(self.arena)))
+            f.write(self.arena)
+            f.write(table.tobytes())
+
     def load(self):
         """Read strings from disk."""
         if not self.path.exists():
             return
-        
+
         with open(self.path, 'rb') as f:
-            # Read count
-            count_bytes = f.read(8)
-            if len(count_bytes) != 8:
-                return
-            count = struct.unpack('<Q', count_bytes)[0]
-            
-            # Read each string
-            for _ in range(count):
-                hash_bytes = f.read(8)
-                len_bytes = f.read(4)
-                if len(hash_bytes) != 8 or len(len_bytes) != 4:
-                    break
-                
-                string_hash = struct.unpack('<Q', hash_bytes)[0]
-                length = struct.unpack('<I', len_bytes)[0]
-                utf8_bytes = f.read(length)
-                
-                if len(utf8_bytes) != length:
-                    break
-                
-                self.strings[string_hash] = utf8_bytes
+            header = f.read(16)
+            if len(header) != 16 or header[0:4] != self.MAGIC:
+                raise ValueError("Invalid string store magic")
+            version = _U16.unpack_from(header, 4)[0]
+            if version != self.VERSION:
+                raise ValueError(f"Unsupported string store version: {version}")
+            count = _U64.unpack_from(header, 6)[0]
+
+            arena_len = _U64.unpack(f.read(8))[0]
+            self.arena = bytearray(f.read(arena_len))
+            table = np.frombuffer(f.read(count * 24), dtype='<u8').reshape(-1, 3)
+
+        self._offsets = {int(h): (int(off), int(length))
+                         for h, off, length in table}
 
 
 # ============================================================================
@@ -449,7 +853,16 @@ class RecordType:
     VARIATION = 2
     NEWLINE = 3
 
-@dataclass
+
+# Module-level bindings of the RecordType values: the hot annotation
+# paths reference these once per record, and a global load is cheaper
+# than the class-attribute lookup.
+_RT_COMMENT = RecordType.COMMENT
+_RT_NAG = RecordType.NAG
+_RT_VARIATION = RecordType.VARIATION
+_RT_NEWLINE = RecordType.NEWLINE
+
+@dataclass(slots=True)
 class AnnotationRecord:
     """A single sparse annotation record for a specific move."""
     move_index: int      # Index into mainline move chain
@@ -472,36 +885,44 @@ class AnnotationRecord:
     
     def serialize(self) -> bytes:
         """Serialize record to bytes."""
-        buf = io.BytesIO()
-        
-        # Write move index as varint
-        self._write_varint(buf, self.move_index)
-        
+        out = bytearray()
+
+        # Write move index as varint. Move indices are almost always below
+        # 2^14, so inline the 1- and 2-byte encodings.
+        value = self.move_index
+        if value < 0x80:
+            out.append(value)
+        elif value < 0x4000:
+            out.append((value & 0x7F) | 0x80)
+            out.append(value >> 7)
+        else:
+            self._write_varint(out, value)
+
         # Build record type byte with flags
         type_byte = self.record_type & 0x07
-        if self.record_type == RecordType.COMMENT:
+        if self.record_type == _RT_COMMENT:
             if self.is_pre:
                 type_byte |= 0x08
             if self.is_semicolon:
                 type_byte |= 0x10
             if self.comment_newline:
                 type_byte |= 0x20
-        elif self.record_type == RecordType.NEWLINE:
+        elif self.record_type == _RT_NEWLINE:
             # Bit 5 used for consistency
             type_byte |= 0x20
-        
-        buf.write(struct.pack('<B', type_byte))
-        
+
+        out.append(type_byte)
+
         # Write type-specific payload
-        if self.record_type == RecordType.COMMENT:
-            buf.write(struct.pack('<Q', self.text_hash))
-        elif self.record_type == RecordType.NAG:
-            buf.write(struct.pack('<B', self.nag_code))
-        elif self.record_type == RecordType.VARIATION:
-            buf.write(struct.pack('<Q', self.variation_move_hash))
-            buf.write(struct.pack('<Q', self.variation_meta_hash))
-        
-        return buf.getvalue()
+        if self.record_type == _RT_COMMENT:
+            out += _U64.pack(self.text_hash)
+        elif self.record_type == _RT_NAG:
+            out.append(self.nag_code)
+        elif self.record_type == _RT_VARIATION:
+            out += _U64.pack(self.variation_move_hash)
+            out += _U64.pack(self.variation_meta_hash)
+
+        return bytes(out)
     
     @staticmethod
     def deserialize(buf: io.BytesIO) -> 'AnnotationRecord':
@@ -510,39 +931,42 @@ class AnnotationRecord:
         move_index = AnnotationRecord._read_varint(buf)
         
         # Read type byte
-        type_byte = struct.unpack('<B', buf.read(1))[0]
+        type_byte = buf.read(1)[0]
         record_type = type_byte & 0x07
         
         rec = AnnotationRecord(move_index=move_index, record_type=record_type)
         
-        if record_type == RecordType.COMMENT:
+        if record_type == _RT_COMMENT:
             rec.is_pre = bool(type_byte & 0x08)
             rec.is_semicolon = bool(type_byte & 0x10)
             rec.comment_newline = bool(type_byte & 0x20)
-            rec.text_hash = struct.unpack('<Q', buf.read(8))[0]
-        elif record_type == RecordType.NAG:
-            rec.nag_code = struct.unpack('<B', buf.read(1))[0]
-        elif record_type == RecordType.VARIATION:
-            rec.variation_move_hash = struct.unpack('<Q', buf.read(8))[0]
-            rec.variation_meta_hash = struct.unpack('<Q', buf.read(8))[0]
+            rec.text_hash = _U64.unpack(buf.read(8))[0]
+        elif record_type == _RT_NAG:
+            rec.nag_code = buf.read(1)[0]
+        elif record_type == _RT_VARIATION:
+            rec.variation_move_hash = _U64.unpack(buf.read(8))[0]
+            rec.variation_meta_hash = _U64.unpack(buf.read(8))[0]
         
         return rec
     
     @staticmethod
-    def _write_varint(buf: io.BytesIO, value: int):
-        """Write unsigned varint."""
+    def _write_varint(out: bytearray, value: int):
+        """Write unsigned varint (slow path for values >= 0x4000)."""
         while value >= 128:
-            buf.write(struct.pack('<B', (value & 0x7F) | 0x80))
+            out.append((value & 0x7F) | 0x80)
             value >>= 7
-        buf.write(struct.pack('<B', value & 0x7F))
-    
+        out.append(value & 0x7F)
+
     @staticmethod
     def _read_varint(buf: io.BytesIO) -> int:
         """Read unsigned varint."""
-        result = 0
-        shift = 0
+        byte = buf.read(1)[0]
+        if byte < 0x80:  # 1-byte fast path: the overwhelmingly common case
+            return byte
+        result = byte & 0x7F
+        shift = 7
         while True:
-            byte = struct.unpack('<B', buf.read(1))[0]
+            byte = buf.read(1)[0]
             result |= (byte & 0x7F) << shift
             if not (byte & 0x80):
                 break
@@ -550,7 +974,7 @@ class AnnotationRecord:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class GameMetadata:
     """Complete metadata for a game (sparse record format)."""
     final_move_hash: int                    # Binds to move chain
@@ -560,27 +984,29 @@ class GameMetadata:
     
     def serialize(self) -> bytes:
         """Serialize metadata blob to bytes."""
-        buf = io.BytesIO()
-        
+        out = bytearray()
+
         # Final move hash binding
-        buf.write(struct.pack('<Q', self.final_move_hash))
-        
-        # STR tags
-        buf.write(struct.pack('<B', len(self.str_tags)))
-        for tag_id in sorted(self.str_tags.keys()):
-            buf.write(struct.pack('<BQ', tag_id, self.str_tags[tag_id]))
-        
+        out += _U64.pack(self.final_move_hash)
+
+        # STR tags: one structured-array dump instead of a pack per entry
+        out += _U8.pack(len(self.str_tags))
+        if self.str_tags:
+            out += np.array(sorted(self.str_tags.items()),
+                            dtype=_STR_TAG_DTYPE).tobytes()
+
         # Extra tags
-        buf.write(struct.pack('<H', len(self.extra_tags)))
-        for name_hash in sorted(self.extra_tags.keys()):
-            buf.write(struct.pack('<QQ', name_hash, self.extra_tags[name_hash]))
-        
+        out += _U16.pack(len(self.extra_tags))
+        if self.extra_tags:
+            out += np.array(sorted(self.extra_tags.items()),
+                            dtype=_EXTRA_TAG_DTYPE).tobytes()
+
         # Annotation records
-        buf.write(struct.pack('<H', len(self.annotation_records)))
+        out += _U16.pack(len(self.annotation_records))
         for rec in self.annotation_records:
-            buf.write(rec.serialize())
-        
-        return buf.getvalue()
+            out += rec.serialize()
+
+        return bytes(out)
     
     @staticmethod
     def deserialize(data: bytes) -> 'GameMetadata':
@@ -588,24 +1014,20 @@ class GameMetadata:
         buf = io.BytesIO(data)
         
         # Final move hash
-        final_move_hash = struct.unpack('<Q', buf.read(8))[0]
-        
+        final_move_hash = _U64.unpack(buf.read(8))[0]
+
         # STR tags
-        str_count = struct.unpack('<B', buf.read(1))[0]
-        str_tags = {}
-        for _ in range(str_count):
-            tag_id, value_hash = struct.unpack('<BQ', buf.read(9))
-            str_tags[tag_id] = value_hash
-        
+        str_count = _U8.unpack(buf.read(1))[0]
+        str_arr = np.frombuffer(buf.read(9 * str_count), dtype=_STR_TAG_DTYPE)
+        str_tags = {int(tag_id): int(value_hash) for tag_id, value_hash in str_arr}
+
         # Extra tags
-        extra_count = struct.unpack('<H', buf.read(2))[0]
-        extra_tags = {}
-        for _ in range(extra_count):
-            name_hash, value_hash = struct.unpack('<QQ', buf.read(16))
-            extra_tags[name_hash] = value_hash
-        
+        extra_count = _U16.unpack(buf.read(2))[0]
+        extra_arr = np.frombuffer(buf.read(16 * extra_count), dtype=_EXTRA_TAG_DTYPE)
+        extra_tags = {int(name_hash): int(value_hash) for name_hash, value_hash in extra_arr}
+
         # Annotation records
-        rec_count = struct.unpack('<H', buf.read(2))[0]
+        rec_count = _U16.unpack(buf.read(2))[0]
         annotation_records = []
         for _ in range(rec_count):
             rec = AnnotationRecord.deserialize(buf)
@@ -616,8 +1038,7 @@ class GameMetadata:
     def compute_hash(self) -> int:
         """Compute hash of metadata blob."""
         data = self.serialize()
-        h = hashlib.blake2b(data, digest_size=8).digest()
-        return struct.unpack('<Q', h)[0]
+        return _content_hash64(data)
 
 
 class MetadataStore:
@@ -701,29 +1122,51 @@ class CCACMStore:
         # Zobrist hashing via chess.polyglot
         self.game_registry: Dict[str, Tuple[int, int]] = {}  # game_id -> (final_move_hash, metadata_hash)
         self.game_registry_sources: Dict[str, int] = {}      # game_id -> source_hash (int)
+        self._variation_cache: Dict[Tuple[int, ...], int] = {}  # packed moves -> chain tail hash
+        self._registry_fp = None                   # append handle for the registry log
+        self._registry_log_bytes = 0               # bytes in the on-disk log
+        self._registry_live_bytes = 0              # bytes the live set would occupy
+        # Blob chains are content-addressed and immutable, so a per-store
+        # LRU over tail hash -> chronological chain is always valid
+        self._blob_chain = lru_cache(maxsize=4096)(self._blob_chain_uncached)
         
         # Load ECO catalog (pre-converted to packed moves)
         self.eco_lines: List[Tuple[str, str, List[int]]] = []  # (code, name, packed_moves)
-        self.eco_trie: Dict[int, Dict] = {}
+        # SoA trie: children[node_id] maps packed move -> child id;
+        # eco_terms[node_id] lists the ECO lines ending at that node
+        self.eco_children: List[Dict[int, int]] = [{}]
+        self.eco_terms: List[Optional[list]] = [None]
         self._load_eco_catalog(eco_path)
         self._build_eco_trie()
         
-        # Ensure initial position blob exists in store
-        self._ensure_init_blob()
-        
         self.packfile.load()
         self.indexfile.load()
         self.string_store.load()
         self.metadata_store.load()
         self.source_store.load()
-        
+
+        # Ensure initial position blob exists in store (after load so it
+        # is only appended when missing from the pack on disk)
+        self._ensure_init_blob()
+
+        # The ECO catalog is fixed input: build every line's blob chain
+        # once up front so ingest can jump straight to a chain tail
+        self.eco_prefix_to_hash: Dict[Tuple[int, ...], int] = {}
+        self._materialize_eco_chains()
+
         self._load_registry()
-    
+
+        # Reverse index: source hash -> game ids in registration order, so
+        # listing/export of one source is O(its games), not a registry scan
+        self.games_by_source: Dict[int, List[str]] = defaultdict(list)
+        for gid, sh in self.game_registry_sources.items():
+            self.games_by_source[sh].append(gid)
+
     def _ensure_init_blob(self):
         """Ensure initial position blob is in the packfile."""
         # The initial blob should already be hashed to INIT_BLOB_HASH
         # We just need to make sure it exists in the store
-        if INIT_BLOB_HASH not in self.packfile.blobs:
+        if INIT_BLOB_HASH not in self.packfile:
             init_blob = MoveBlob(
                 parent_hash=0,
                 moves=[],
@@ -736,23 +1179,77 @@ class CCACMStore:
     
     def _load_registry(self):
         """Load game registry from disk."""
-        registry_path = self.dir / "registry"
-        if registry_path.exists():
-            with open(registry_path, 'r') as f:
-                for line in f:
-                    if line.strip():
-                        # Split from right to handle game_ids with colons
-                        parts = line.strip().rsplit(':', 3)
-                        if len(parts) >= 3:
-                            game_id = parts[0]
-                            move_hash_str = parts[1]
-                            meta_hash_str = parts[2]
-                            source_hash_str = parts[3] if len(parts) >= 4 else "0"
-                            self.game_registry[game_id] = (int(move_hash_str, 16), int(meta_hash_str, 16))
-                            try:
-                                self.game_registry_sources[game_id] = int(source_hash_str, 16)
-                            except Exception:
-                                self.game_registry_sources[game_id] = 0
+        bin_path = self.dir / "registry.bin"
+        if bin_path.exists():
+            self._load_registry_bin(bin_path)
+        else:
+            # One-time migration: stores written before registry.bin used a
+            # hex-text registry; it is rewritten in binary on the next save
+            text_path = self.dir / "registry"
+            if text_path.exists():
+                self._load_registry_text(text_path)
+
+        self._registry_log_bytes = bin_path.stat().st_size if bin_path.exists() else 0
+        self._registry_live_bytes = sum(
+            26 + len(game_id.encode('utf-8')) for game_id in self.game_registry)
+
+    @staticmethod
+    def _pack_registry_record(game_id: str, move_hash: int, meta_hash: int,
+                              src_hash: int) -> bytes:
+        gid = game_id.encode('utf-8')
+        return _U16.pack(len(gid)) + gid + _REG_QQQ.pack(move_hash, meta_hash, src_hash)
+
+    def _append_registry_record(self, game_id: str, move_hash: int,
+                                meta_hash: int, src_hash: int):
+        """Append one record to the registry log (O(1) per game).
+
+        The log replays last-wins on load, so re-registering a game id
+        just appends; compaction happens in _save_registry once the log
+        doubles its live size.
+        """
+        if self._registry_fp is None:
+            self._registry_fp = open(self.dir / "registry.bin", 'ab')
+        rec = self._pack_registry_record(game_id, move_hash, meta_hash, src_hash)
+        self._registry_fp.write(rec)
+        self._registry_log_bytes += len(rec)
+
+    def _load_registry_bin(self, bin_path: Path):
+        """Parse the binary registry: fixed-layout records over one mmap."""
+        with open(bin_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                pos = 0
+                while pos + 2 <= size:
+                    (id_len,) = _U16.unpack_from(mm, pos)
+                    pos += 2
+                    if pos + id_len + 24 > size:
+                        break  # truncated trailing record
+                    game_id = mm[pos:pos + id_len].decode('utf-8')
+                    pos += id_len
+                    move_hash, meta_hash, src_hash = _REG_QQQ.unpack_from(mm, pos)
+                    pos += 24
+                    self.game_registry[game_id] = (move_hash, meta_hash)
+                    self.game_registry_sources[game_id] = src_hash
+
+    def _load_registry_text(self, registry_path: Path):
+        """Parse the legacy hex-text registry format."""
+        with open(registry_path, 'r') as f:
+            for line in f:
+                if line.strip():
+                    # Split from right to handle game_ids with colons
+                    parts = line.strip().rsplit(':', 3)
+                    if len(parts) >= 3:
+                        game_id = parts[0]
+                        move_hash_str = parts[1]
+                        meta_hash_str = parts[2]
+                        source_hash_str = parts[3] if len(parts) >= 4 else "0"
+                        self.game_registry[game_id] = (int(move_hash_str, 16), int(meta_hash_str, 16))
+                        try:
+                            self.game_registry_sources[game_id] = int(source_hash_str, 16)
+                        except Exception:
+                            self.game_registry_sources[game_id] = 0
     
     def _load_eco_catalog(self, eco_path: str):
         """Load ECO opening classifications and convert to packed moves."""
@@ -760,17 +1257,32 @@ class CCACMStore:
             print(f"Warning: ECO file not found at {eco_path}, ECO deduplication disabled")
             return
 
-        cache_path = eco_path + ".cache"
+        # Flat-array cache: marshal round-trips a few large bytes objects
+        # in one C pass instead of rebuilding every tuple/list through
+        # pickle opcodes. Per-line strings and move lists are sliced out
+        # of a string table and one packed u16 move array on load.
+        cache_path = eco_path + ".cache2"
         try:
             if os.path.exists(cache_path):
                 with open(cache_path, 'rb') as cf:
-                    cache = pickle.load(cf)
-                src_mtime = os.path.getmtime(eco_path)
-                src_size = os.path.getsize(eco_path)
+                    cache = marshal.load(cf)
+                st = os.stat(eco_path)  # one stat for mtime and size
+                src_mtime = st.st_mtime
+                src_size = st.st_size
                 if cache.get('src_mtime') == src_mtime and cache.get('src_size') == src_size:
-                    cached_lines = cache.get('eco_lines')
-                    if cached_lines:
-                        self.eco_lines = cached_lines
+                    strtab = cache['strtab']
+                    moves = array('H')
+                    moves.frombytes(cache['moves'])
+                    idx = array('I')
+                    idx.frombytes(cache['idx'])
+                    for i in range(0, len(idx), 6):
+                        code_off, code_len, name_off, name_len, mv_off, mv_len = idx[i:i + 6]
+                        self.eco_lines.append((
+                            strtab[code_off:code_off + code_len].decode('utf-8'),
+                            strtab[name_off:name_off + name_len].decode('utf-8'),
+                            moves[mv_off:mv_off + mv_len].tolist(),
+                        ))
+                    if self.eco_lines:
                         print(f"Loaded {len(self.eco_lines)} ECO lines (from cache)")
                         return
         except Exception:
@@ -789,8 +1301,11 @@ class CCACMStore:
                     if game:
                         packed_moves = []
                         node = game
-                        while node.variations:
-                            node = node.variation(0)
+                        while True:
+                            v = node.variations
+                            if not v:
+                                break
+                            node = v[0]
                             packed_moves.append(encode_move_packed(node.move))
                         
                         # Only include ECO lines with >= 6 ply
@@ -800,24 +1315,51 @@ class CCACMStore:
                     pass  # Skip malformed entries
         
         try:
-            src_mtime = os.path.getmtime(eco_path)
-            src_size = os.path.getsize(eco_path)
+            st = os.stat(eco_path)
+            src_mtime = st.st_mtime
+            src_size = st.st_size
+            strtab = bytearray()
+            moves = array('H')
+            idx = array('I')
+            for code, name, packed in self.eco_lines:
+                code_b = code.encode('utf-8')
+                name_b = name.encode('utf-8')
+                idx.extend((len(strtab), len(code_b),
+                            len(strtab) + len(code_b), len(name_b),
+                            len(moves), len(packed)))
+                strtab += code_b + name_b
+                moves.extend(packed)
             with open(cache_path, 'wb') as cf:
-                pickle.dump({'src_mtime': src_mtime, 'src_size': src_size, 'eco_lines': self.eco_lines}, cf)
+                marshal.dump({'src_mtime': src_mtime, 'src_size': src_size,
+                              'strtab': bytes(strtab), 'moves': moves.tobytes(),
+                              'idx': idx.tobytes()}, cf)
         except Exception:
             pass
         
         print(f"Loaded {len(self.eco_lines)} ECO lines (>= 6 ply)")
 
     def _build_eco_trie(self):
-        """Build a prefix trie for ECO packed moves to speed up matching."""
-        root: Dict[int, Dict] = {}
+        """Build a prefix trie for ECO packed moves to speed up matching.
+
+        Laid out as parallel arrays indexed by node id rather than nested
+        dicts: walking is integer indexing with no per-node '_end'
+        membership test, and terminal lists live in their own column.
+        """
+        children = self.eco_children = [{}]
+        terms = self.eco_terms = [None]
         for eco_code, eco_name, eco_packed in self.eco_lines:
-            node = root
+            node = 0
             for move in eco_packed:
-                node = node.setdefault(move, {})
-            node.setdefault('_end', []).append((eco_code, eco_name, eco_packed))
-        self.eco_trie = root
+                nxt = children[node].get(move)
+                if nxt is None:
+                    nxt = len(children)
+                    children[node][move] = nxt
+                    children.append({})
+                    terms.append(None)
+                node = nxt
+            if terms[node] is None:
+                terms[node] = []
+            terms[node].append((eco_code, eco_name, eco_packed))
     
     def _find_matching_eco_lines(self, packed_moves: List[int]) -> List[Tuple[str, str, List[int]]]:
         """
@@ -825,16 +1367,32 @@ class CCACMStore:
         Returns list of (code, name, packed_eco_moves) sorted by length (shortest first).
         """
         matches = []
-        node = self.eco_trie
+        children = self.eco_children
+        terms = self.eco_terms
+        node = 0
         for move in packed_moves:
-            node = node.get(move)
+            node = children[node].get(move)
             if node is None:
                 break
-            if '_end' in node:
+            t = terms[node]
+            if t:
                 # As we walk moves, we encounter prefixes in increasing length order
-                matches.extend(node['_end'])
+                matches.extend(t)
         return matches
     
+    def _materialize_eco_chains(self) -> None:
+        """Create the blob chain for every ECO line and cache its tail hash.
+
+        Chains dedup against the loaded packfile (and against each other:
+        shorter lines are materialized first, so longer ones reuse their
+        prefix blobs), after which ECO handling during ingest is a dict
+        lookup instead of repeated find_blob_by_moves/add_blob work.
+        """
+        for eco_code, eco_name, eco_packed in sorted(self.eco_lines, key=lambda e: len(e[2])):
+            key = tuple(eco_packed)
+            if key not in self.eco_prefix_to_hash:
+                self.eco_prefix_to_hash[key] = self._create_eco_blob_chain(eco_packed, INIT_BLOB_HASH)
+
     def _create_eco_blob_chain(self, eco_packed: List[int], parent_hash: int) -> int:
         """
         Create blob chain for an ECO sequence.
@@ -869,116 +1427,104 @@ class CCACMStore:
         return current_parent
     
     def _save_registry(self):
-        """Save game registry to disk."""
-        registry_path = self.dir / "registry"
-        with open(registry_path, 'w') as f:
-            for game_id, (move_hash, meta_hash) in self.game_registry.items():
-                src_hash = self.game_registry_sources.get(game_id, 0)
-                f.write(f"{game_id}:{move_hash:016x}:{meta_hash:016x}:{src_hash:016x}\n")
+        """Flush the registry log; compact it when it outgrows live size.
+
+        Ingest already appended every record, so the common save is just a
+        flush. A log smaller than the live set means records exist only in
+        memory (fresh text-registry migration); one more than twice the
+        live size means enough superseded records to be worth rewriting.
+        """
+        if self._registry_fp is not None:
+            self._registry_fp.flush()
+        live = self._registry_live_bytes
+        log = self._registry_log_bytes
+        if (log < live or log > 2 * live) and self.game_registry:
+            self._compact_registry()
+
+    def _compact_registry(self):
+        """Atomically rewrite the registry log from the in-memory state."""
+        if self._registry_fp is not None:
+            self._registry_fp.close()
+            self._registry_fp = None
+        out = bytearray()
+        for game_id, (move_hash, meta_hash) in self.game_registry.items():
+            src_hash = self.game_registry_sources.get(game_id, 0)
+            out += self._pack_registry_record(game_id, move_hash, meta_hash, src_hash)
+        tmp_path = self.dir / "registry.bin.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(out)
+        os.replace(tmp_path, self.dir / "registry.bin")
+        self._registry_log_bytes = len(out)
+        self._registry_live_bytes = len(out)
     
     def _ingest_variation(self, start_node: chess.pgn.ChildNode) -> Tuple[int, int]:
         """
         Ingest a variation branch as a separate move chain.
+        Extracts both moves and annotations (including nested variations).
         Returns (final_move_hash, metadata_hash).
         """
         # Collect moves in this variation
         moves = []
         node = start_node
-        while not node.is_end():
-            moves.append(node.move)
-            if node.variations:
-                node = node.variation(0)  # Follow mainline within variation
-            else:
+        while True:
+            # is_end() is just `not self.variations`; checking the list
+            # directly avoids a method call per ply
+            v = node.variations
+            if not v:
                 break
+            moves.append(node.move)
+            node = v[0]  # Follow mainline within variation
         
-        # Ingest the move chain similar to ingest_game
-        packed_moves = []
-        board = start_node.parent.board()
-        for move in moves:
-            packed_moves.append(encode_move_packed(move))
-            board.push(move)
-        
-        # Split into blobs (max 22 moves per blob)
-        parent_hash = INIT_BLOB_HASH
-        for i in range(0, len(packed_moves), 22):
-            chunk = packed_moves[i:i+22]
-            
-            blob = MoveBlob(
-                parent_hash=parent_hash,
-                moves=chunk,
-                result=3  # Unknown
-            )
-            
-            parent_hash = self.packfile.add_blob(blob)
-        
-        # Extract annotations from variation
-        annotations = self._extract_annotations_from_node(start_node)
+        # Ingest the move chain (packing needs no board context, and
+        # node.parent.board() would replay every move from the root)
+        packed_moves = list(map(encode_move_packed, moves))
+
+        final_move_hash = self._variation_chain(packed_moves)
+
+        # Now extract annotations from this variation (including nested variations)
+        annotations = self._extract_annotations_for_variation(start_node)
         
         # Create metadata for variation
         meta = GameMetadata(
+            final_move_hash=final_move_hash,
             str_tags={},
             extra_tags={},
             annotation_records=annotations
         )
         
-        meta_bytes = meta.serialize(self.string_store)
-        meta_hash = self.metadata_store.add_metadata(meta_bytes)
+        meta_hash = self.metadata_store.add_metadata(meta)
         
-        return parent_hash, meta_hash
-    
-    def _ingest_variation(self, start_node: chess.pgn.ChildNode) -> Tuple[int, int]:
-        """
-        Ingest a variation branch as a separate move chain.
-        Extracts both moves and annotations (including nested variations).
-        Returns (final_move_hash, metadata_hash).
+        return final_move_hash, meta_hash
+
+    def _variation_chain(self, packed_moves: List[int]) -> int:
+        """Blob chain for a variation's packed moves, memoized per store.
+
+        Annotated games repeat variations (transpositions, re-quoted
+        lines); the chain always roots at INIT_BLOB_HASH, so the packed
+        move tuple alone keys the cache. Metadata is still built per
+        call — only the serialize/hash/add_blob work is skipped.
         """
-        # Collect moves in this variation
-        moves = []
-        node = start_node
-        while not node.is_end():
-            moves.append(node.move)
-            if node.variations:
-                node = node.variation(0)  # Follow mainline within variation
-            else:
-                break
-        
-        # Ingest the move chain
-        packed_moves = []
-        board = start_node.parent.board()
-        for move in moves:
-            packed_moves.append(encode_move_packed(move))
-            board.push(move)
-        
+        key = tuple(packed_moves)
+        cached = self._variation_cache.get(key)
+        if cached is not None:
+            return cached
+
         # Split into blobs (max 22 moves per blob)
         parent_hash = INIT_BLOB_HASH
-        final_move_hash = INIT_BLOB_HASH  # Track the final blob hash
+        final_move_hash = INIT_BLOB_HASH
         for i in range(0, len(packed_moves), 22):
             chunk = packed_moves[i:i+22]
-            
             blob = MoveBlob(
                 parent_hash=parent_hash,
                 moves=chunk,
                 result=3
             )
-            
             parent_hash = self.packfile.add_blob(blob)
-            final_move_hash = parent_hash  # Update to latest hash
-        
-        # Now extract annotations from this variation (including nested variations)
-        annotations = self._extract_annotations_for_variation(start_node)
-        
-        # Create metadata for variation
-        meta = GameMetadata(
-            final_move_hash=final_move_hash,
-            str_tags={},
-            extra_tags={},
-            annotation_records=annotations
-        )
-        
-        meta_hash = self.metadata_store.add_metadata(meta)
-        
-        return final_move_hash, meta_hash
-    
+            final_move_hash = parent_hash
+
+        self._variation_cache[key] = final_move_hash
+        return final_move_hash
+
     def _extract_annotations_for_variation(self, start_node: chess.pgn.ChildNode) -> List[AnnotationRecord]:
         """Extract annotations from a variation (recursively handles nested variations)."""
         records = []
@@ -986,7 +1532,10 @@ class CCACMStore:
         
         node = start_node
         is_first_move = True
-        while not node.is_end():
+        while True:
+            v = node.variations
+            if not v:
+                break
             # Comments
             if node.comment:
                 comment_text = node.comment.strip()
@@ -998,7 +1547,7 @@ class CCACMStore:
                     text_hash = self.string_store.add_string(comment_text)
                     rec = AnnotationRecord(
                         move_index=move_index,
-                        record_type=RecordType.COMMENT,
+                        record_type=_RT_COMMENT,
                         text_hash=text_hash,
                         is_pre=False,
                         is_semicolon=is_semicolon,
@@ -1010,7 +1559,7 @@ class CCACMStore:
             for nag in node.nags:
                 rec = AnnotationRecord(
                     move_index=move_index,
-                    record_type=RecordType.NAG,
+                    record_type=_RT_NAG,
                     nag_code=nag
                 )
                 records.append(rec)
@@ -1022,30 +1571,30 @@ class CCACMStore:
                     var_move_hash, var_meta_hash = self._ingest_variation(var_node)
                     rec = AnnotationRecord(
                         move_index=move_index,
-                        record_type=RecordType.VARIATION,
+                        record_type=_RT_VARIATION,
                         variation_move_hash=var_move_hash,
                         variation_meta_hash=var_meta_hash
                     )
                     records.append(rec)
             
-            if node.variations:
-                node = node.variation(0)
-                is_first_move = False
-                move_index += 1
-            else:
-                break
-        
+            node = v[0]
+            is_first_move = False
+            move_index += 1
+
         return records
     
     def _extract_annotations(self, game: chess.pgn.GameNode) -> List[AnnotationRecord]:
         """Extract annotations (comments, NAGs, variations) from PGN game tree."""
+        add_string = self.string_store.add_string
+        Record = AnnotationRecord  # LOAD_FAST in the per-record hot path
         records = []
         move_index = 0
-        
-        node = game
-        while not node.is_end():
-            node = node.next()
-            
+
+        # Single pass over mainline(); tracking prev ourselves gives the
+        # alternatives as prev.variations[1:] without re-reading
+        # node.parent, and drops the is_end()/next() pair per ply
+        prev = game
+        for node in game.mainline():
             # Comments
             if node.comment:
                 comment_text = node.comment.strip()
@@ -1053,43 +1602,39 @@ class CCACMStore:
                     is_semicolon = comment_text.startswith(';')
                     if is_semicolon:
                         comment_text = comment_text[1:].strip()
-                    
-                    text_hash = self.string_store.add_string(comment_text)
-                    rec = AnnotationRecord(
+
+                    records.append(Record(
                         move_index=move_index,
-                        record_type=RecordType.COMMENT,
-                        text_hash=text_hash,
+                        record_type=_RT_COMMENT,
+                        text_hash=add_string(comment_text),
                         is_pre=False,
                         is_semicolon=is_semicolon,
                         comment_newline=False
-                    )
-                    records.append(rec)
-            
+                    ))
+
             # NAGs
             for nag in node.nags:
-                rec = AnnotationRecord(
+                records.append(Record(
                     move_index=move_index,
-                    record_type=RecordType.NAG,
+                    record_type=_RT_NAG,
                     nag_code=nag
-                )
-                records.append(rec)
-            
-            # Variations (alternative moves from this position)
-            if len(node.parent.variations) > 1:
-                # node.parent.variations[0] is the mainline (the move we just processed)
-                # Remaining variations are alternatives
-                for var_node in node.parent.variations[1:]:
+                ))
+
+            # Variations (alternative moves from this position);
+            # prev.variations[0] is the mainline move we just processed
+            if len(prev.variations) > 1:
+                for var_node in prev.variations[1:]:
                     var_move_hash, var_meta_hash = self._ingest_variation(var_node)
-                    rec = AnnotationRecord(
+                    records.append(Record(
                         move_index=move_index,
-                        record_type=RecordType.VARIATION,
+                        record_type=_RT_VARIATION,
                         variation_move_hash=var_move_hash,
                         variation_meta_hash=var_meta_hash
-                    )
-                    records.append(rec)
-            
+                    ))
+
+            prev = node
             move_index += 1
-        
+
         return records
     
     def ingest_game(self, game: chess.pgn.GameNode, game_id: Optional[str] = None, source_hash: Optional[int] = None) -> Tuple[int, int]:
@@ -1111,20 +1656,13 @@ class CCACMStore:
         # Extract annotations
         annotation_records = self._extract_annotations(game)
         
-        # Convert moves to packed format
-        packed_moves = []
-        board = game.board()
-        for move in moves:
-            packed_moves.append(encode_move_packed(move))
-            board.push(move)
-
-        # Helper to advance a board by packed moves incrementally
-        def _apply_packed(board_obj: chess.Board, packed_seq):
-            for move_hash in packed_seq:
-                move = decode_move_packed(move_hash, board_obj)
-                if move:
-                    board_obj.push(move)
-        
+        # Convert moves to packed format. Packing needs no board context,
+        # and nothing below reads a board state: blob chunking works on the
+        # packed list alone, so the old push-per-move replay (and the second
+        # decode+push pass realigning after the ECO prefix) was pure
+        # overhead and is gone. list(map(...)) keeps the loop in C.
+        packed_moves = list(map(encode_move_packed, moves))
+
         # Find matching ECO lines and use only the longest match
         eco_matches = self._find_matching_eco_lines(packed_moves)
         parent_hash = INIT_BLOB_HASH
@@ -1142,37 +1680,21 @@ class CCACMStore:
             
             # Only use ECO parent if it saves blobs or breaks even
             if blobs_with_eco <= blobs_without_eco:
-                parent_hash = self._create_eco_blob_chain(eco_packed, INIT_BLOB_HASH)
+                parent_hash = self.eco_prefix_to_hash[tuple(eco_packed)]
                 move_idx = eco_len
 
-        # Align board to the state after ECO moves (once)
-        board = game.board()
-        if move_idx:
-            _apply_packed(board, packed_moves[:move_idx])
-        
         # Continue with remaining moves after ECO sequences
         blob_hashes = []
         
         while move_idx < len(packed_moves):
-            # Try to find the longest existing blob that matches from this position
-            best_match_hash = None
-            best_match_len = 0
-            
-            # Try different chunk sizes, largest first
-            for chunk_size in range(min(27, len(packed_moves) - move_idx), 0, -1):
-                chunk = packed_moves[move_idx:move_idx + chunk_size]
-                
-                # Look for existing blob with this parent and moves
-                existing_hash = self.packfile.find_blob_by_moves(parent_hash, chunk)
-                if existing_hash is not None:
-                    best_match_hash = existing_hash
-                    best_match_len = chunk_size
-                    break  # Found a match, use it
-            
+            # Find the longest existing blob matching from this position
+            # via the rolling-hash children index
+            best_match_hash, best_match_len = self.packfile.longest_child(
+                parent_hash, packed_moves, move_idx,
+                min(27, len(packed_moves) - move_idx))
+
             if best_match_hash is not None:
-                # Reuse existing blob and advance board by its moves
-                chunk = packed_moves[move_idx:move_idx + best_match_len]
-                _apply_packed(board, chunk)
+                # Reuse existing blob
                 blob_hashes.append(best_match_hash)
                 parent_hash = best_match_hash
                 move_idx += best_match_len
@@ -1181,9 +1703,6 @@ class CCACMStore:
                 chunk_size = min(27, len(packed_moves) - move_idx)
                 chunk = packed_moves[move_idx:move_idx + chunk_size]
 
-                # Advance board incrementally
-                _apply_packed(board, chunk)
-
                 # Determine result for this blob
                 is_final = (move_idx + chunk_size == len(packed_moves))
                 blob_result = result if is_final else 3
@@ -1211,32 +1730,191 @@ class CCACMStore:
         )
         
         meta_hash = self.metadata_store.add_metadata(metadata)
-        self.game_registry[game_id] = (final_hash, meta_hash)
-        if source_hash is not None:
-            self.game_registry_sources[game_id] = source_hash
+        self._register_game(game_id, final_hash, meta_hash, source_hash)
         
         return (final_hash, meta_hash)
-    
+
+    def _materialize_annotations(self, pre_records: List['PrepackedAnnotation']) -> List[AnnotationRecord]:
+        """Turn prepacked annotations into store records.
+
+        Interns comment strings and ingests variation subtrees; this is
+        the store-side half of what _extract_annotations does inline.
+        """
+        records = []
+        for pre in pre_records:
+            if pre.record_type == _RT_COMMENT:
+                records.append(AnnotationRecord(
+                    move_index=pre.move_index,
+                    record_type=_RT_COMMENT,
+                    text_hash=self.string_store.add_string(pre.text),
+                    is_pre=False,
+                    is_semicolon=pre.is_semicolon,
+                    comment_newline=False
+                ))
+            elif pre.record_type == _RT_NAG:
+                records.append(AnnotationRecord(
+                    move_index=pre.move_index,
+                    record_type=_RT_NAG,
+                    nag_code=pre.nag_code
+                ))
+            elif pre.record_type == _RT_VARIATION:
+                var_move_hash, var_meta_hash = self._ingest_prepacked_variation(pre.variation)
+                records.append(AnnotationRecord(
+                    move_index=pre.move_index,
+                    record_type=_RT_VARIATION,
+                    variation_move_hash=var_move_hash,
+                    variation_meta_hash=var_meta_hash
+                ))
+        return records
+
+    def _ingest_prepacked_variation(self, var: 'PrepackedVariation') -> Tuple[int, int]:
+        """Ingest a prepacked variation subtree (mirrors _ingest_variation)."""
+        final_move_hash = self._variation_chain(var.packed_moves)
+
+        meta = GameMetadata(
+            final_move_hash=final_move_hash,
+            str_tags={},
+            extra_tags={},
+            annotation_records=self._materialize_annotations(var.annotations)
+        )
+        meta_hash = self.metadata_store.add_metadata(meta)
+
+        return final_move_hash, meta_hash
+
+    def ingest_prepacked(self, pre: 'PrepackedGame', game_id: Optional[str] = None, source_hash: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Ingest a PrepackedGame produced by prepack_game / worker processes.
+        Same store-side behavior as ingest_game, minus the parsing and move
+        encoding the worker already did.
+        Returns (final_move_hash, metadata_hash).
+        """
+        if game_id is None:
+            game_id = f"game_{len(self.game_registry)}"
+
+        str_tags = {i: self.string_store.add_string(v) for i, v in pre.str_tags.items()}
+        extra_tags = {}
+        for name, value in pre.extra_tags:
+            # Intern name before value so the string arena matches ingest_game
+            name_hash = self.string_store.add_string(name)
+            extra_tags[name_hash] = self.string_store.add_string(value)
+
+        annotation_records = self._materialize_annotations(pre.annotations)
+
+        packed_moves = pre.packed_moves
+        result = pre.result
+
+        # Find matching ECO lines and use only the longest match
+        eco_matches = self._find_matching_eco_lines(packed_moves)
+        parent_hash = INIT_BLOB_HASH
+        move_idx = 0
+
+        if eco_matches:
+            eco_code, eco_name, eco_packed = eco_matches[-1]  # Last match is longest
+            eco_len = len(eco_packed)
+            game_len = len(packed_moves)
+
+            blobs_with_eco = (eco_len + 26) // 27 + (game_len - eco_len + 26) // 27
+            blobs_without_eco = (game_len + 26) // 27
+
+            if blobs_with_eco <= blobs_without_eco:
+                parent_hash = self.eco_prefix_to_hash[tuple(eco_packed)]
+                move_idx = eco_len
+
+        # Continue with remaining moves after ECO sequences
+        blob_hashes = []
+
+        while move_idx < len(packed_moves):
+            best_match_hash, best_match_len = self.packfile.longest_child(
+                parent_hash, packed_moves, move_idx,
+                min(27, len(packed_moves) - move_idx))
+
+            if best_match_hash is not None:
+                blob_hashes.append(best_match_hash)
+                parent_hash = best_match_hash
+                move_idx += best_match_len
+            else:
+                chunk_size = min(27, len(packed_moves) - move_idx)
+                chunk = packed_moves[move_idx:move_idx + chunk_size]
+
+                is_final = (move_idx + chunk_size == len(packed_moves))
+                blob_result = result if is_final else 3
+
+                blob = MoveBlob(
+                    parent_hash=parent_hash,
+                    moves=chunk,
+                    result=blob_result
+                )
+
+                blob_hash = self.packfile.add_blob(blob)
+                blob_hashes.append(blob_hash)
+                parent_hash = blob_hash
+                move_idx += chunk_size
+
+        final_hash = blob_hashes[-1] if blob_hashes else parent_hash
+
+        metadata = GameMetadata(
+            final_move_hash=final_hash,
+            str_tags=str_tags,
+            extra_tags=extra_tags,
+            annotation_records=annotation_records
+        )
+
+        meta_hash = self.metadata_store.add_metadata(metadata)
+        self._register_game(game_id, final_hash, meta_hash, source_hash)
+
+        return (final_hash, meta_hash)
+
+    def _register_game(self, game_id: str, final_hash: int, meta_hash: int,
+                       source_hash: Optional[int]):
+        """Record a game in the in-memory registry and append to the log."""
+        if game_id not in self.game_registry:
+            self._registry_live_bytes += 26 + len(game_id.encode('utf-8'))
+        self.game_registry[game_id] = (final_hash, meta_hash)
+        if source_hash is not None:
+            old_hash = self.game_registry_sources.get(game_id)
+            if old_hash != source_hash:
+                if old_hash is not None:
+                    # Re-registration under a new source: drop the stale entry
+                    old_list = self.games_by_source.get(old_hash)
+                    if old_list and game_id in old_list:
+                        old_list.remove(game_id)
+                self.game_registry_sources[game_id] = source_hash
+                self.games_by_source[source_hash].append(game_id)
+        self._append_registry_record(game_id, final_hash, meta_hash,
+                                     self.game_registry_sources.get(game_id, 0))
+
+    def assign_source(self, game_ids, source_hash: int):
+        """Attach source_hash to already-registered games.
+
+        Single-pass import only knows the source hash once the file has
+        been fully read; the registry log is append-only and replays
+        last-wins, so re-registering each game just appends a record.
+        """
+        for game_id in game_ids:
+            entry = self.game_registry.get(game_id)
+            if entry is not None:
+                self._register_game(game_id, entry[0], entry[1], source_hash)
+
     def _extract_str_tags(self, headers: chess.pgn.Headers) -> Dict[int, int]:
         """Extract STR tags (Seven Tag Roster) from PGN headers."""
-        str_tags = {}
-        for i, tag_name in enumerate(STR_TAG_NAMES):
-            if tag_name in headers:
-                value_hash = self.string_store.add_string(headers[tag_name])
-                str_tags[i] = value_hash
-        return str_tags
+        present = [(i, headers[tag_name])
+                   for i, tag_name in enumerate(STR_TAG_NAMES)
+                   if tag_name in headers]
+        hashes = self.string_store.add_strings(value for _, value in present)
+        return {i: value_hash for (i, _), value_hash in zip(present, hashes)}
     
     def _extract_extra_tags(self, headers: chess.pgn.Headers) -> Dict[int, int]:
         """Extract non-STR tags from PGN headers."""
         str_tag_set = set(STR_TAG_NAMES)
-        extra_tags = {}
+        # Include all tags, preserve empty strings as-is; names interleave
+        # before values so the arena layout matches the per-call order
+        flat = []
         for tag_name, tag_value in headers.items():
             if tag_name not in str_tag_set:
-                # Include all tags, preserve empty strings as-is
-                name_hash = self.string_store.add_string(tag_name)
-                value_hash = self.string_store.add_string(tag_value)
-                extra_tags[name_hash] = value_hash
-        return extra_tags
+                flat.append(tag_name)
+                flat.append(tag_value)
+        hashes = self.string_store.add_strings(flat)
+        return {hashes[i]: hashes[i + 1] for i in range(0, len(hashes), 2)}
     
     def reconstruct_game(self, game_id: str) -> List[chess.Move]:
         """Reconstruct a game from its blobs."""
@@ -1244,59 +1922,84 @@ class CCACMStore:
             return []
         
         final_hash, meta_hash = self.game_registry[game_id]
-        
-        # First, walk backward to collect all blobs in reverse order
-        blob_chain = []
-        current_hash = final_hash
-        while current_hash not in (0, INIT_BLOB_HASH):
-            blob = self.packfile.get_blob(current_hash)
-            if not blob:
-                break
-            blob_chain.append(blob)
-            current_hash = blob.parent_hash
-        
-        # Reverse to get chronological order (first blob first)
-        blob_chain.reverse()
-        
-        # Now decode all moves in order
+
+        # Decode all moves in chronological order. Stored moves were legal
+        # at ingest, so no board replay is needed to decode them.
         moves = []
-        board = chess.Board()
-        for blob in blob_chain:
-            for move_packed in blob.moves:
-                move = decode_move_packed(move_packed, board)
-                if move:
-                    moves.append(move)
-                    board.push(move)
+        for blob in self._blob_chain(final_hash):
+            decode_packed_moves(blob.moves, moves)
         
         return moves
     
-    def reconstruct_game_pgn(self, game_id: str) -> chess.pgn.Game:
-        """Reconstruct a complete game as PGN including headers and annotations."""
-        if game_id not in self.game_registry:
+    def reconstruct_headers(self, game_id: str) -> Optional[Dict[str, str]]:
+        """Reconstruct only a game's header tags from its metadata blob.
+
+        Header-only callers (game listings, filters) get the tags without
+        the move-chain walk that reconstruct_game_pgn performs.
+        """
+        entry = self.game_registry.get(game_id)
+        if entry is None:
             return None
-        
-        final_hash, meta_hash = self.game_registry[game_id]
-        meta = self.metadata_store.get_metadata(meta_hash)
-        
-        # Create new game
-        game = chess.pgn.Game()
-        
-        # Restore headers from STR tags
+        meta = self.metadata_store.get_metadata(entry[1])
+
+        headers = {}
+        # STR tags first, extra tags after, matching PGN header order
         str_tag_names = ['Event', 'Site', 'Date', 'Round', 'White', 'Black', 'Result']
         for tag_id, string_hash in meta.str_tags.items():
             if tag_id < len(str_tag_names):
-                tag_name = str_tag_names[tag_id]
                 tag_value = self.string_store.get_string(string_hash)
                 if tag_value:
-                    game.headers[tag_name] = tag_value
-        
-        # Restore extra tags
+                    headers[str_tag_names[tag_id]] = tag_value
+
         for name_hash, value_hash in meta.extra_tags.items():
             tag_name = self.string_store.get_string(name_hash)
             tag_value = self.string_store.get_string(value_hash)
             if tag_name is not None and tag_value is not None:
-                game.headers[tag_name] = tag_value
-        
+                headers[tag_name] = tag_value
+        return headers
+
+    def get_game_headers(self, game_id: str) -> Optional[Dict[str, str]]:
+        """STR headers only, straight off the in-memory metadata blob.
+
+        Listings display a handful of roster tags; this skips the extra
+        tags and their string-store lookups that reconstruct_headers
+        resolves.
+        """
+        entry = self.game_registry.get(game_id)
+        if entry is None:
+            return None
+        meta = self.metadata_store.get_metadata(entry[1])
+
+        get_string = self.string_store.get_string
+        headers = {}
+        for tag_id, string_hash in meta.str_tags.items():
+            if tag_id < len(STR_TAG_NAMES):
+                tag_value = get_string(string_hash)
+                if tag_value:
+                    headers[STR_TAG_NAMES[tag_id]] = tag_value
+        return headers
+
+    def reconstruct_game_pgn(self, game_id: str) -> chess.pgn.Game:
+        """Reconstruct a complete game as PGN including headers and annotations."""
+        if game_id not in self.game_registry:
+            return None
+
+        final_hash, meta_hash = self.game_registry[game_id]
+        meta = self.metadata_store.get_metadata(meta_hash)
+
+        # Create new game
+        game = chess.pgn.Game()
+
+        # Restore headers
+        for tag_name, tag_value in self.reconstruct_headers(game_id).items():
+            game.headers[tag_name] = tag_value
+
+        # Group annotation records by move index once: O(M+R) instead of
+        # rescanning every record for every move
+        by_idx = defaultdict(list)
+        for rec in meta.annotation_records:
+            by_idx[rec.move_index].append(rec)
+
         # Reconstruct moves
         moves = self.reconstruct_game(game_id)
         node = game
@@ -1304,50 +2007,49 @@ class CCACMStore:
             node = node.add_variation(move)
             
             # Add annotations (comments, NAGs, variations) for this move
-            for rec in meta.annotation_records:
-                if rec.move_index == i:
-                    if rec.record_type == RecordType.COMMENT:
-                        comment_text = self.string_store.get_string(rec.text_hash)
-                        if comment_text:
-                            if rec.is_semicolon:
-                                comment_text = '; ' + comment_text
-                            node.comment = comment_text
-                    elif rec.record_type == RecordType.NAG:
-                        node.nags.add(rec.nag_code)
-                    elif rec.record_type == RecordType.VARIATION:
-                        # Recursively reconstruct variation
-                        var_moves = self._reconstruct_variation_moves(rec.variation_move_hash)
-                        var_node = node
-                        for var_move in var_moves:
-                            var_node = var_node.add_variation(var_move)
+            for rec in by_idx.get(i, ()):
+                if rec.record_type == _RT_COMMENT:
+                    comment_text = self.string_store.get_string(rec.text_hash)
+                    if comment_text:
+                        if rec.is_semicolon:
+                            comment_text = '; ' + comment_text
+                        node.comment = comment_text
+                elif rec.record_type == _RT_NAG:
+                    node.nags.add(rec.nag_code)
+                elif rec.record_type == _RT_VARIATION:
+                    # Recursively reconstruct variation
+                    var_moves = self._reconstruct_variation_moves(rec.variation_move_hash)
+                    var_node = node
+                    for var_move in var_moves:
+                        var_node = var_node.add_variation(var_move)
         
         return game
     
-    def _reconstruct_variation_moves(self, move_hash: int) -> List[chess.Move]:
-        """Reconstruct moves from a variation move hash."""
-        moves = []
-        current_hash = move_hash
-        blob_chain = []
-        
-        # Walk backward to collect blobs
+    def _blob_chain_uncached(self, final_hash: int) -> Tuple[MoveBlob, ...]:
+        """Chronological blob chain ending at final_hash.
+
+        Walks the parent pointers backward once and reverses; cached via
+        self._blob_chain so repeated reconstructions (bulk export, shared
+        ECO prefixes, re-quoted variations) skip the walk entirely.
+        """
+        chain = []
+        current_hash = final_hash
         while current_hash not in (0, INIT_BLOB_HASH):
             blob = self.packfile.get_blob(current_hash)
             if not blob:
                 break
-            blob_chain.append(blob)
+            chain.append(blob)
             current_hash = blob.parent_hash
-        
-        # Reverse for chronological order
-        blob_chain.reverse()
-        
-        # Decode moves
+        chain.reverse()
+        return tuple(chain)
+
+    def _reconstruct_variation_moves(self, move_hash: int) -> List[chess.Move]:
+        """Reconstruct moves from a variation move hash."""
+        moves = []
+        # Decode moves (validated replay; see apply_packed_moves)
         board = chess.Board()
-        for blob in blob_chain:
-            for move_packed in blob.moves:
-                move = decode_move_packed(move_packed, board)
-                if move:
-                    moves.append(move)
-                    board.push(move)
+        for blob in self._blob_chain(move_hash):
+            apply_packed_moves(board, blob.moves, moves)
         
         return moves
     
@@ -1362,6 +2064,375 @@ class CCACMStore:
         self.source_store.save()
 
 
+# ============================================================================
+# PART 5.5: PARALLEL INGEST (PREPACKED GAMES)
+# ============================================================================
+#
+# PGN parsing and move encoding dominate ingest time but need no store
+# state, so they can run in worker processes. Workers turn raw PGN text
+# into a PrepackedGame: packed move lists, plain-string tags and comments,
+# and recursively prepacked variations. Blob insertion, dedup against the
+# existing packfile, ECO chain reuse and string interning all depend on
+# global store state, so those stay single-threaded in the main process
+# (ingest_prepacked). Parsing is the bulk of the work, so Amdahl still
+# pays off.
+
+@dataclass(slots=True)
+class PrepackedVariation:
+    """A variation subtree with moves packed and annotations as plain data."""
+    packed_moves: List[int]
+    annotations: List['PrepackedAnnotation']
+
+
+@dataclass(slots=True)
+class PrepackedAnnotation:
+    """An annotation with string payloads not yet interned in a store."""
+    move_index: int
+    record_type: int
+    text: Optional[str] = None          # COMMENT
+    is_semicolon: bool = False          # COMMENT
+    nag_code: Optional[int] = None      # NAG
+    variation: Optional[PrepackedVariation] = None  # VARIATION
+
+
+@dataclass(slots=True)
+class PrepackedGame:
+    """A parsed game ready for store-side ingestion.
+
+    Everything that requires only the PGN text is done: moves are packed,
+    tags and comments are raw strings, variations are prepacked subtrees.
+    """
+    str_tags: Dict[int, str]            # STR index -> value
+    extra_tags: List[Tuple[str, str]]   # (name, value) in header order
+    result: int
+    packed_moves: List[int]
+    annotations: List[PrepackedAnnotation]
+
+
+def _prepack_variation(start_node: chess.pgn.ChildNode) -> PrepackedVariation:
+    """Prepack a variation branch (mirrors _ingest_variation's walk)."""
+    packed_moves = []
+    node = start_node
+    while True:
+        v = node.variations
+        if not v:
+            break
+        packed_moves.append(encode_move_packed(node.move))
+        node = v[0]
+
+    return PrepackedVariation(
+        packed_moves=packed_moves,
+        annotations=_prepack_variation_annotations(start_node),
+    )
+
+
+def _prepack_comment(node: chess.pgn.GameNode, move_index: int) -> Optional[PrepackedAnnotation]:
+    """Prepack a node's comment, or None if it is empty."""
+    comment_text = node.comment.strip()
+    if not comment_text:
+        return None
+    is_semicolon = comment_text.startswith(';')
+    if is_semicolon:
+        comment_text = comment_text[1:].strip()
+    return PrepackedAnnotation(
+        move_index=move_index,
+        record_type=_RT_COMMENT,
+        text=comment_text,
+        is_semicolon=is_semicolon,
+    )
+
+
+def _prepack_variation_annotations(start_node: chess.pgn.ChildNode) -> List[PrepackedAnnotation]:
+    """Prepack annotations within a variation (nested variations recurse)."""
+    records = []
+    move_index = 0
+
+    node = start_node
+    is_first_move = True
+    while True:
+        v = node.variations
+        if not v:
+            break
+        if node.comment:
+            rec = _prepack_comment(node, move_index)
+            if rec:
+                records.append(rec)
+
+        for nag in node.nags:
+            records.append(PrepackedAnnotation(
+                move_index=move_index,
+                record_type=_RT_NAG,
+                nag_code=nag,
+            ))
+
+        # Skip alternatives on the first move: that is the fork point where
+        # we entered this variation (same rule as _extract_annotations_for_variation)
+        if not is_first_move and len(node.parent.variations) > 1:
+            for var_node in node.parent.variations[1:]:
+                records.append(PrepackedAnnotation(
+                    move_index=move_index,
+                    record_type=_RT_VARIATION,
+                    variation=_prepack_variation(var_node),
+                ))
+
+        node = v[0]
+        is_first_move = False
+        move_index += 1
+
+    return records
+
+
+def prepack_game(game: chess.pgn.GameNode) -> PrepackedGame:
+    """Convert a parsed PGN game into a PrepackedGame (no store state needed)."""
+    str_tag_set = set(STR_TAG_NAMES)
+    str_tags = {}
+    for i, tag_name in enumerate(STR_TAG_NAMES):
+        if tag_name in game.headers:
+            str_tags[i] = game.headers[tag_name]
+    extra_tags = [(name, value) for name, value in game.headers.items()
+                  if name not in str_tag_set]
+
+    # Mainline annotations (mirrors _extract_annotations's walk)
+    records = []
+    move_index = 0
+    node = game
+    while True:
+        v = node.variations
+        if not v:
+            break
+        node = v[0]
+
+        if node.comment:
+            rec = _prepack_comment(node, move_index)
+            if rec:
+                records.append(rec)
+
+        for nag in node.nags:
+            records.append(PrepackedAnnotation(
+                move_index=move_index,
+                record_type=_RT_NAG,
+                nag_code=nag,
+            ))
+
+        if len(node.parent.variations) > 1:
+            for var_node in node.parent.variations[1:]:
+                records.append(PrepackedAnnotation(
+                    move_index=move_index,
+                    record_type=_RT_VARIATION,
+                    variation=_prepack_variation(var_node),
+                ))
+
+        move_index += 1
+
+    packed_moves = list(map(encode_move_packed, game.mainline_moves()))
+
+    return PrepackedGame(
+        str_tags=str_tags,
+        extra_tags=extra_tags,
+        result=RESULT_MAP.get(game.headers.get('Result', '*'), 3),
+        packed_moves=packed_moves,
+        annotations=records,
+    )
+
+
+@dataclass(slots=True)
+class _VisitorNode:
+    """Per-move annotation buffer collected by PrepackVisitor."""
+    comments: List[str]
+    nags: set
+    variations: List[PrepackedVariation]
+    parent: Optional['_VisitorNode']
+
+
+@dataclass(slots=True)
+class _VisitorLevel:
+    """One mainline or variation chain being collected by PrepackVisitor."""
+    packed_moves: List[int]
+    nodes: List[_VisitorNode]
+    attach: Optional[_VisitorNode]  # move this variation is an alternative to
+
+
+class PrepackVisitor(chess.pgn.BaseVisitor):
+    """Builds a PrepackedGame straight from parser events.
+
+    Equivalent to prepack_game(chess.pgn.read_game(...)) without ever
+    constructing the GameNode tree: moves are packed as they are visited
+    and annotations land in flat per-move buffers. The game-tree walk
+    quirks of prepack_game are reproduced deliberately — a variation's
+    final move (and its annotations) is dropped, alternatives to a
+    variation's first move are skipped, and starting comments and root
+    annotations are discarded — so both parse paths fill the store
+    identically.
+    """
+
+    def begin_game(self):
+        self._headers = chess.pgn.Headers()
+        root = _VisitorNode([], set(), [], None)
+        self._root = root
+        self._levels = [_VisitorLevel([], [], None)]
+        self._node_stack = [root]
+        self._in_variation = False
+        self._pre: Optional[PrepackedGame] = None
+
+    def begin_headers(self) -> chess.pgn.Headers:
+        # Hand the parser a real Headers so variant/FEN detection works
+        return self._headers
+
+    def visit_header(self, tagname: str, tagvalue: str):
+        self._headers[tagname] = tagvalue
+
+    def visit_move(self, board: chess.Board, move: chess.Move):
+        node = _VisitorNode([], set(), [], self._node_stack[-1])
+        level = self._levels[-1]
+        level.packed_moves.append(encode_move_packed(move))
+        level.nodes.append(node)
+        self._node_stack[-1] = node
+        self._in_variation = True
+
+    def visit_comment(self, comment: str):
+        # Starting comments (before a move) attach to nodes prepack_game
+        # never reads, so only in-variation comments are kept
+        if self._in_variation:
+            self._node_stack[-1].comments.append(comment)
+
+    def visit_nag(self, nag: int):
+        self._node_stack[-1].nags.add(nag)
+
+    def begin_variation(self):
+        attach = self._node_stack[-1]
+        self._node_stack.append(attach.parent)
+        self._levels.append(_VisitorLevel([], [], attach))
+        self._in_variation = False
+
+    def end_variation(self):
+        level = self._levels.pop()
+        self._node_stack.pop()
+        if level.packed_moves:
+            moves, records = self._flush_level(level, is_variation=True)
+            level.attach.variations.append(
+                PrepackedVariation(packed_moves=moves, annotations=records))
+
+    def visit_result(self, result: str):
+        if self._headers.get("Result", "*") == "*":
+            self._headers["Result"] = result
+
+    @staticmethod
+    def _flush_level(level: _VisitorLevel,
+                     is_variation: bool) -> Tuple[List[int], List[PrepackedAnnotation]]:
+        """Turn a level's buffers into (packed_moves, annotation records)."""
+        nodes = level.nodes
+        moves = level.packed_moves
+        if is_variation:
+            # The chain walk in _prepack_variation stops at the last node
+            # with children, dropping the leaf move and its annotations
+            nodes = nodes[:-1]
+            moves = moves[:-1]
+        records = []
+        for j, buf in enumerate(nodes):
+            if buf.comments:
+                comment_text = " ".join(filter(None, buf.comments)).strip()
+                if comment_text:
+                    is_semicolon = comment_text.startswith(';')
+                    if is_semicolon:
+                        comment_text = comment_text[1:].strip()
+                    records.append(PrepackedAnnotation(
+                        move_index=j,
+                        record_type=_RT_COMMENT,
+                        text=comment_text,
+                        is_semicolon=is_semicolon,
+                    ))
+            for nag in buf.nags:
+                records.append(PrepackedAnnotation(
+                    move_index=j,
+                    record_type=_RT_NAG,
+                    nag_code=nag,
+                ))
+            if buf.variations and not (is_variation and j == 0):
+                for var in buf.variations:
+                    records.append(PrepackedAnnotation(
+                        move_index=j,
+                        record_type=_RT_VARIATION,
+                        variation=var,
+                    ))
+        return moves, records
+
+    def end_game(self):
+        moves, records = self._flush_level(self._levels[0], is_variation=False)
+        str_tag_set = set(STR_TAG_NAMES)
+        str_tags = {}
+        for i, tag_name in enumerate(STR_TAG_NAMES):
+            if tag_name in self._headers:
+                str_tags[i] = self._headers[tag_name]
+        extra_tags = [(name, value) for name, value in self._headers.items()
+                      if name not in str_tag_set]
+        self._pre = PrepackedGame(
+            str_tags=str_tags,
+            extra_tags=extra_tags,
+            result=RESULT_MAP.get(self._headers.get('Result', '*'), 3),
+            packed_moves=moves,
+            annotations=records,
+        )
+
+    def handle_error(self, error: Exception):
+        # Log and continue, as GameBuilder does, instead of aborting the file
+        chess.pgn.LOGGER.error("%s while parsing game", error)
+
+    def result(self) -> Optional[PrepackedGame]:
+        return self._pre
+
+
+def prepack_worker(pgn_text: str) -> Optional[PrepackedGame]:
+    """Pool worker: parse one game's PGN text and prepack it."""
+    return chess.pgn.read_game(io.StringIO(pgn_text), Visitor=PrepackVisitor)
+
+
+def split_pgn_games(f) -> Iterator[str]:
+    """Split a PGN stream into raw per-game text chunks.
+
+    A game starts at a tag-pair line that follows movetext; this matches
+    how chess.pgn delimits games without paying for a full parse. Brace
+    comments are tracked across lines so that a command annotation like
+    [%clk 0:05:00] sitting at the start of a line inside a multi-line
+    {...} comment is not mistaken for the next game's first tag pair.
+    """
+    lines: List[str] = []
+    seen_movetext = False
+    in_comment = False
+    for line in f:
+        stripped = line.strip()
+        if stripped.startswith('[') and seen_movetext and not in_comment:
+            yield ''.join(lines)
+            lines = []
+            seen_movetext = False
+        elif stripped and not in_comment and not stripped.startswith(('[', '%')):
+            seen_movetext = True
+        lines.append(line)
+
+        # Carry {...} comment state to the next line; a ';' outside a
+        # brace comment discards the rest of the line. Tag-pair lines
+        # are consumed atomically by chess.pgn and never open a comment,
+        # so a stray brace in a header value must not be scanned.
+        if not in_comment and stripped.startswith('['):
+            continue
+        pos = 0
+        while True:
+            if in_comment:
+                end = line.find('}', pos)
+                if end == -1:
+                    break
+                in_comment = False
+                pos = end + 1
+            else:
+                brace = line.find('{', pos)
+                semi = line.find(';', pos)
+                if brace == -1 or (semi != -1 and semi < brace):
+                    break
+                in_comment = True
+                pos = brace + 1
+    if any(line.strip() for line in lines):
+        yield ''.join(lines)
+
+
 # ============================================================================
 # TESTING
 # ============================================================================
@@ -1393,16 +2464,21 @@ def main() -> None:
     )
     source_hash = store.source_store.add(source_entry)
     
+    # Overlap parsing and storage: workers run the pure-Python PGN
+    # tokenizer and move packing over raw game texts while this process
+    # drives blob/metadata insertion, which must stay single-threaded to
+    # preserve packfile ordering and dedup invariants.
+    import multiprocessing
+
     games_loaded = 0
-    with open(pgn_file, 'r') as f:
-        while True:
-            game = chess.pgn.read_game(f)
-            if game is None:
-                break
-            
-            store.ingest_game(game, f"game_{games_loaded}", source_hash=source_hash)
+    with open(pgn_file, 'r') as f, multiprocessing.Pool() as pool:
+        for pre in pool.imap(prepack_worker, split_pgn_games(f), chunksize=64):
+            if pre is None:
+                continue
+
+            store.ingest_prepacked(pre, f"game_{games_loaded}", source_hash=source_hash)
             games_loaded += 1
-            
+
             if games_loaded % 1000 == 0:
                 print(f"  Loaded {games_loaded} games...")
     
@@ -1411,7 +2487,7 @@ def main() -> None:
     
     print(f"\nStore statistics:")
     print(f"  Total games: {len(store.game_registry)}")
-    print(f"  Total blobs: {len(store.packfile.blobs)}")
+    print(f"  Total blobs: {len(store.packfile)}")
     print(f"  Pack file size: {len(store.packfile.blob_order) * 64} bytes")
     
     # Test reconstruction
@@ -9,10 +9,17 @@ Chess Content-Addressable Move-Chain format.
 import sys
 import os
 import argparse
+import hashlib
+import heapq
+import io
+import signal
+from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional, Tuple
 import time
-import hashlib
+
+import numpy as np
 
 import ccamc
 import chess.pgn
@@ -38,27 +45,39 @@ def find_store(start_path: Optional[str] = None) -> Optional[Path]:
     """
     if start_path is None:
         start_path = os.getcwd()
-    
+
     current = Path(start_path).resolve()
-    
-    # Check if current directory has .positional/ subdirectory
-    positional_dir = current / '.positional'
-    if positional_dir.is_dir() and (positional_dir / 'config').exists():
+
+    # Check if current directory has .positional/ subdirectory. A single
+    # stat of .positional/config covers the old is_dir()+exists() pair:
+    # the config file can only exist inside a directory.
+    if _has_store_config(current):
         return current
-    
+
     # Check if current directory IS a bare store (has config file directly)
-    if (current / 'config').exists():
+    try:
+        os.stat(current / 'config')
         return current
-    
-    # Walk up the tree looking for .positional/
-    for parent in [current] + list(current.parents):
-        positional_dir = parent / '.positional'
-        if positional_dir.is_dir() and (positional_dir / 'config').exists():
+    except OSError:
+        pass
+
+    # Walk up the tree looking for .positional/ (current is already checked)
+    for parent in current.parents:
+        if _has_store_config(parent):
             return parent
-    
+
     return None
 
 
+def _has_store_config(path: Path) -> bool:
+    """True if path/.positional/config exists (one stat syscall)."""
+    try:
+        os.stat(path / '.positional' / 'config')
+        return True
+    except OSError:
+        return False
+
+
 def get_store_path(workspace: Path) -> Path:
     """Get the actual store directory from workspace directory."""
     positional_dir = workspace / '.positional'
@@ -84,50 +103,91 @@ def ensure_store(start_path: Optional[str] = None) -> Path:
 
 class ProgressReporter:
     """Progress reporter for long-running operations."""
-    
+
+    # Sliding window over this: [30 - filled : 60 - filled] is the bar,
+    # built with one slice instead of three string allocations per draw
+    _BAR = '=' * 30 + '>' + ' ' * 29
+
     def __init__(self, quiet: bool = False):
         self.quiet = quiet
-        self.last_update = 0
-        self.start_time = time.time()
-    
+        self.last_update = 0.0
+        self.start_time = time.monotonic()
+        # Counter gate: the common skipped path is a compare+increment,
+        # with the clock consulted only every _next_check calls
+        self._calls = 0
+        self._next_check = 64
+        self._last_current = 0
+        # stderr is unbuffered for our purposes; write() skips print's
+        # separator/end handling and per-call flush checks
+        self._write = sys.stderr.write
+
     def update(self, current: int, total: Optional[int] = None, force: bool = False):
         """Update progress display."""
         if self.quiet:
             return
-        
-        now = time.time()
+
+        if not force:
+            self._calls += 1
+            if self._calls < self._next_check:
+                return
+            self._calls = 0
+
+        now = time.monotonic()
         if not force and now - self.last_update < 0.5:
             return
-        
+
+        # Aim the next clock check ~0.5s out based on observed throughput
+        self._next_check = max(256, current - self._last_current)
+        self._last_current = current
         self.last_update = now
-        
+        self._draw(current, total, now)
+
+    def _draw(self, current: int, total: Optional[int], now: float):
         if total is not None:
             pct = (current / total * 100) if total > 0 else 0
             bar_width = 30
             filled = int(bar_width * current / total) if total > 0 else 0
-            bar = '=' * filled + '>' + ' ' * (bar_width - filled - 1)
-            
+            bar = self._BAR[bar_width - filled:2 * bar_width - filled]
+
             elapsed = now - self.start_time
             rate = current / elapsed if elapsed > 0 else 0
-            
-            print(f"\rProgress: {current:,} / {total:,} [{bar}] {pct:.0f}% ({rate:.1f}/s)", 
-                  end='', file=sys.stderr)
+
+            self._write(f"\rProgress: {current:,} / {total:,} [{bar}] {pct:.0f}% ({rate:.1f}/s)")
         else:
-            print(f"\rProcessed: {current:,}", end='', file=sys.stderr)
-    
+            self._write(f"\rProcessed: {current:,}")
+
+    def update_fast(self, current: int, total: Optional[int] = None):
+        """Progress update for very hot loops.
+
+        The common path is a single bitmask test; every 1024 items it
+        goes straight to the clock throttle. The 1024-item stride has
+        already done the rationing that update()'s counter gate exists
+        for — and that gate counts calls, not items, so routing through
+        it from here would leave the bar almost never redrawn.
+        """
+        if current & 0x3FF or self.quiet:
+            return
+        now = time.monotonic()
+        if now - self.last_update < 0.5:
+            return
+        self._last_current = current
+        self.last_update = now
+        self._draw(current, total, now)
+
     def finish(self):
         """Complete progress display."""
         if not self.quiet:
-            print(file=sys.stderr)
+            self._write('\n')
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def format_size(bytes_val: int) -> str:
     """Format bytes as human-readable size."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if bytes_val < 1024:
-            return f"{bytes_val:.1f} {unit}"
-        bytes_val /= 1024
-    return f"{bytes_val:.1f} TB"
+    # bit_length picks the unit directly: one division, no loop or list
+    i = min(max((bytes_val.bit_length() - 1) // 10, 0), 4)
+    return f"{bytes_val / (1 << (i * 10)):.1f} {_SIZE_UNITS[i]}"
 
 
 def format_duration(seconds: float) -> str:
@@ -176,6 +236,31 @@ def cmd_init(args):
     return 0
 
 
+class HashingReader(io.RawIOBase):
+    """Raw reader that tees every byte into an incremental hash.
+
+    Lets cmd_import compute the source SHA-256 during the parse pass
+    instead of reading the whole file twice.
+    """
+
+    def __init__(self, raw, hasher):
+        self._raw = raw
+        self._hasher = hasher
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        n = self._raw.readinto(b)
+        if n:
+            self._hasher.update(memoryview(b)[:n])
+        return n
+
+    def close(self):
+        self._raw.close()
+        super().close()
+
+
 def cmd_import(args):
     """Import a PGN file into the store."""
     store_path = ensure_store(args.C)
@@ -191,17 +276,107 @@ def cmd_import(args):
     
     # Load store (automatically loads in __init__)
     store = ccamc.CCACMStore(str(store_path))
+
+    # The source SHA-256 is computed by teeing the parse pass through a
+    # HashingReader, so the file is read once; games are registered
+    # without a source during the loop and backfilled once the hash is
+    # known (the registry log replays last-wins, so this just appends).
+
+    # Import games. Flushing every N games rewrites the index/registry
+    # files O(N/100) times over an import; flush on accumulated arena
+    # growth instead, with a 30s time backstop checked every 256 games.
+    progress = ProgressReporter(quiet=args.quiet)
+    game_count = 0
+    flush_bytes = args.flush_bytes
+    last_flush = time.monotonic()
+    flushed_arena = len(store.packfile.arena)
+
+    def maybe_flush():
+        nonlocal last_flush, flushed_arena
+        if (len(store.packfile.arena) - flushed_arena > flush_bytes
+                or (game_count & 0xFF == 0
+                    and time.monotonic() - last_flush > 30.0)):
+            store.save()
+            last_flush = time.monotonic()
+            flushed_arena = len(store.packfile.arena)
+
+    if not args.quiet:
+        print(f"Importing: {pgn_path.name}", file=sys.stderr)
     
-    # Calculate file hash and size
+    jobs = getattr(args, 'jobs', 1)
+
+    # Ctrl-C during an import sets a flag instead of raising
+    # KeyboardInterrupt out of an arbitrary bytecode mid-ingest; the loop
+    # checks it every 1024 games and exits through store.save(), so
+    # partial progress is persisted rather than lost.
+    interrupted = False
+
+    def on_sigint(signum, frame):
+        nonlocal interrupted
+        interrupted = True
+
+    prev_handler = signal.signal(signal.SIGINT, on_sigint)
+
+    # 1 MiB buffer: read_game issues many small reads, and the default
+    # 8 KiB text buffer turns a multi-GB dump into millions of syscalls
+    hasher = hashlib.sha256()
+    raw = open(pgn_path, 'rb', buffering=0)
+    try:
+        with io.TextIOWrapper(io.BufferedReader(HashingReader(raw, hasher),
+                                                buffer_size=1 << 20)) as f:
+            if jobs > 1:
+                # Parse and pack moves in worker processes; blob insertion and
+                # dedup stay in this process because they need the live store.
+                # imap preserves file order so game ids match the serial path.
+                import multiprocessing
+                with multiprocessing.Pool(jobs) as pool:
+                    for pre in pool.imap(ccamc.prepack_worker,
+                                         ccamc.split_pgn_games(f), chunksize=256):
+                        if pre is None:
+                            continue
+
+                        game_id = f"{args.label}:{game_count}"
+                        move_hash, meta_hash = store.ingest_prepacked(pre, game_id, None)
+
+                        game_count += 1
+                        progress.update_fast(game_count)
+                        maybe_flush()
+                        if interrupted and not game_count & 0x3FF:
+                            break
+            else:
+                while True:
+                    # PrepackVisitor skips GameNode tree construction entirely;
+                    # the prepacked record feeds the same store-side ingest as
+                    # the parallel path
+                    pre = chess.pgn.read_game(f, Visitor=ccamc.PrepackVisitor)
+                    if pre is None:
+                        break
+
+                    game_id = f"{args.label}:{game_count}"
+                    move_hash, meta_hash = store.ingest_prepacked(pre, game_id, None)
+
+                    game_count += 1
+                    progress.update_fast(game_count)
+                    maybe_flush()
+                    if interrupted and not game_count & 0x3FF:
+                        break
+    finally:
+        signal.signal(signal.SIGINT, prev_handler)
+
+    progress.finish()
+
+    if interrupted:
+        # The source entry needs the full-file hash, so games ingested
+        # before the interrupt stay unsourced; re-importing the same file
+        # dedups against them and backfills the source.
+        store.save()
+        print(f"\nInterrupted: {game_count:,} games saved", file=sys.stderr)
+        sys.exit(130)
+
+    # Create the source entry now that the file hash is known, and
+    # backfill it onto the games registered above
     file_size = pgn_path.stat().st_size
-    sha256 = hashlib.sha256()
-    with open(pgn_path, 'rb') as f:
-        while chunk := f.read(8192):
-            sha256.update(chunk)
-    file_hash = sha256.hexdigest()
-    
-    # Create source entry
-    from datetime import datetime, timezone
+    file_hash = hasher.hexdigest()
     source_entry = ccamc.SourceEntry(
         label=args.label,
         imported_at=datetime.now(timezone.utc).isoformat(),
@@ -209,36 +384,13 @@ def cmd_import(args):
         source_sha256_hex=file_hash
     )
     source_hash = store.source_store.add(source_entry)
-    
-    # Import games
-    progress = ProgressReporter(quiet=args.quiet)
-    game_count = 0
-    
-    if not args.quiet:
-        print(f"Importing: {pgn_path.name}", file=sys.stderr)
-    
-    with open(pgn_path, 'r') as f:
-        while True:
-            game = chess.pgn.read_game(f)
-            if game is None:
-                break
-            
-            game_id = f"{args.label}:{game_count}"
-            move_hash, meta_hash = store.ingest_game(game, game_id, source_hash)
-            
-            game_count += 1
-            progress.update(game_count)
-            
-            # Flush periodically for memory efficiency
-            if game_count % 100 == 0:
-                store.save()
-    
-    progress.finish()
-    
+    store.assign_source((f"{args.label}:{i}" for i in range(game_count)),
+                        source_hash)
+
     # Final save
     store.save()
     
-    elapsed = time.time() - progress.start_time
+    elapsed = time.monotonic() - progress.start_time
     
     if args.quiet:
         print(f"{source_hash:016x}")
@@ -272,24 +424,29 @@ def cmd_export(args):
         print(f"fatal: source not found: {args.source_label}", file=sys.stderr)
         sys.exit(4)
     
-    # Find all games for this source
-    game_ids = []
-    for game_id in store.game_registry.keys():
-        src_hash = store.game_registry_sources.get(game_id, 0)
-        if src_hash == source_hash:
-            game_ids.append(game_id)
-    
-    # Export games
+    # All games for this source, in registration order
+    game_ids = store.games_by_source.get(source_hash, [])
+
+    # Export games (hot attributes bound once outside the loop). Games
+    # are written through a 1 MiB buffer over the byte stream so a bulk
+    # export is not throttled by line-buffered stdout flushes.
     progress = ProgressReporter(quiet=args.quiet)
     total = len(game_ids)
-    
+    reconstruct = store.reconstruct_game_pgn
+    update = progress.update
+
+    sys.stdout.flush()  # anything printed so far goes out first
+    out = io.BufferedWriter(sys.stdout.buffer, buffer_size=1 << 20)
+    write = out.write
     for idx, game_id in enumerate(game_ids):
-        game = store.reconstruct_game_pgn(game_id)
+        game = reconstruct(game_id)
         if game:
-            print(game, end='\n\n')
-        
-        progress.update(idx + 1, total)
-    
+            write(str(game).encode('utf-8'))
+            write(b'\n\n')
+
+        update(idx + 1, total)
+    out.flush()
+
     progress.finish()
     return 0
 
@@ -306,31 +463,48 @@ def cmd_list(args):
     # Load store (automatically loads in __init__)
     store = ccamc.CCACMStore(str(store_path))
     
-    # Count games per source
-    source_game_counts = {}
-    for game_id in store.game_registry.keys():
-        src_hash = store.game_registry_sources.get(game_id, 0)
-        source_game_counts[src_hash] = source_game_counts.get(src_hash, 0) + 1
-    
-    # Print table
+    # Count games per source: the hashes are u64s, so the tally is a
+    # vectorized unique/count over one contiguous array rather than a
+    # per-game hash-table update
+    source_hashes = np.fromiter(store.game_registry_sources.values(),
+                                dtype=np.uint64,
+                                count=len(store.game_registry_sources))
+    uniq, counts = np.unique(source_hashes, return_counts=True)
+    source_game_counts = dict(zip(uniq.tolist(), counts.tolist()))
+    unsourced = len(store.game_registry) - len(store.game_registry_sources)
+    if unsourced > 0:
+        # Games registered without a source counted under hash 0, as the
+        # old per-game .get(game_id, 0) loop did
+        source_game_counts[0] = source_game_counts.get(0, 0) + unsourced
+
+    sources = store.source_store.sources
+    limit = getattr(args, 'limit', None)
+    if limit is not None:
+        # Partial sort: O(N log limit) instead of sorting every source
+        sorted_items = heapq.nsmallest(limit, sources.items(), key=itemgetter(0))
+    else:
+        sorted_items = sorted(sources.items())
+
+    # Print table; rows are batched into one write so a large listing
+    # does not flush line-buffered stdout per source
     print(f"{'SOURCE':<10} {'LABEL':<30} {'GAMES':<8} {'SIZE':<10} {'IMPORTED':<20}")
-    
-    total_sources = 0
-    total_games = 0
-    total_size = 0
-    
-    for src_hash, entry in sorted(store.source_store.sources.items()):
+
+    rows = []
+    get_count = source_game_counts.get
+    for src_hash, entry in sorted_items:
         short_hash = f"{src_hash:016x}"[:8]
-        game_count = source_game_counts.get(src_hash, 0)
+        game_count = get_count(src_hash, 0)
         size_str = format_size(entry.byte_size)
         imported = entry.imported_at[:10] if len(entry.imported_at) >= 10 else entry.imported_at
-        
-        print(f"{short_hash:<10} {entry.label[:30]:<30} {game_count:<8,} {size_str:<10} {imported:<20}")
-        
-        total_sources += 1
-        total_games += game_count
-        total_size += entry.byte_size
-    
+
+        rows.append(f"{short_hash:<10} {entry.label[:30]:<30} {game_count:<8,} {size_str:<10} {imported:<20}\n")
+    sys.stdout.write(''.join(rows))
+
+    # Totals always cover the whole store, not just the rows shown
+    total_sources = len(sources)
+    total_games = sum(source_game_counts.get(sh, 0) for sh in sources)
+    total_size = sum(entry.byte_size for entry in sources.values())
+
     print()
     print(f"Total: {total_sources} sources, {total_games:,} games, {format_size(total_size)}")
     
@@ -357,13 +531,9 @@ def cmd_show(args):
         print(f"fatal: source not found: {args.source_label}", file=sys.stderr)
         sys.exit(4)
     
-    # Find all games for this source
-    games = []
-    for game_id in store.game_registry.keys():
-        src_hash = store.game_registry_sources.get(game_id, 0)
-        if src_hash == source_hash:
-            games.append(game_id)
-    
+    # All games for this source, in registration order
+    games = store.games_by_source.get(source_hash, [])
+
     # Display source info
     print(f"Source: {source_hash:016x}")
     print(f"Label: {source_entry.label}")
@@ -376,15 +546,15 @@ def cmd_show(args):
     # Show game list (first 20, then summary)
     print("Games:")
     for idx, game_id in enumerate(games[:20]):
-        # Reconstruct game to get headers
-        game = store.reconstruct_game_pgn(game_id)
-        if game:
-            white = game.headers.get('White', '?')
-            black = game.headers.get('Black', '?')
-            result = game.headers.get('Result', '*')
-            event = game.headers.get('Event', '?')
-            date = game.headers.get('Date', '?')
-            
+        # Roster tags only: the preview displays nothing else
+        headers = store.get_game_headers(game_id)
+        if headers is not None:
+            white = headers.get('White', '?')
+            black = headers.get('Black', '?')
+            result = headers.get('Result', '*')
+            event = headers.get('Event', '?')
+            date = headers.get('Date', '?')
+
             print(f"  {game_id}: {white} - {black} {result} ({event}, {date})")
     
     if len(games) > 20:
@@ -400,21 +570,25 @@ def cmd_stats(args):
     # Load store (automatically loads in __init__)
     store = ccamc.CCACMStore(str(store_path))
     
-    # Calculate file sizes
-    moves_size = (store_path / 'moves').stat().st_size if (store_path / 'moves').exists() else 0
-    idx_size = (store_path / 'idx').stat().st_size if (store_path / 'idx').exists() else 0
-    metadata_size = (store_path / 'metadata').stat().st_size if (store_path / 'metadata').exists() else 0
-    strings_size = (store_path / 'strings').stat().st_size if (store_path / 'strings').exists() else 0
-    registry_size = (store_path / 'registry').stat().st_size if (store_path / 'registry').exists() else 0
-    sources_size = (store_path / 'sources').stat().st_size if (store_path / 'sources').exists() else 0
+    # Calculate file sizes with one directory scan: DirEntry.stat() is
+    # served from the scandir readdir data where the platform allows,
+    # instead of an exists()+stat() syscall pair per file
+    sizes = {e.name: e.stat().st_size for e in os.scandir(store_path) if e.is_file()}
+    moves_size = sizes.get('moves', 0)
+    idx_size = sizes.get('idx', 0)
+    metadata_size = sizes.get('metadata', 0)
+    strings_size = sizes.get('strings', 0)
+    # Fall back to the legacy text registry for stores never saved since
+    registry_size = sizes.get('registry.bin', sizes.get('registry', 0))
+    sources_size = sizes.get('sources', 0)
     
     total_size = moves_size + idx_size + metadata_size + strings_size + registry_size + sources_size
     
     # Count entities
     num_games = len(store.game_registry)
     num_sources = len(store.source_store.sources)
-    num_blobs = len(store.packfile.blobs)
-    num_strings = len(store.string_store.strings)
+    num_blobs = len(store.packfile)
+    num_strings = len(store.string_store)
     
     # Calculate total source size
     total_source_size = sum(entry.byte_size for entry in store.source_store.sources.values())
@@ -468,25 +642,45 @@ def cmd_verify(args):
     # Verify blob chains
     report("Verifying store integrity...")
     
-    num_blobs = len(store.packfile.blobs)
+    num_blobs = len(store.packfile)
     report(f"✓ Checked {num_blobs:,} move blobs")
     
-    # Verify all game chains
+    # Verify all game chains. A chain can only break at a blob whose
+    # parent hash is unknown, so one vectorized membership test over the
+    # parent-hash column plus one over the registry's final hashes proves
+    # every chain intact (parent links are content hashes, so cycles
+    # cannot occur). The per-game walk runs only to attribute breaks.
     broken_chains = []
-    for game_id, (final_hash, meta_hash) in store.game_registry.items():
-        # Try to reconstruct the chain
-        chain = []
-        current_hash = final_hash
-        
-        while current_hash != ccamc.INIT_BLOB_HASH and current_hash != ccamc.ORPHAN_PARENT_HASH:
-            blob = store.packfile.get_blob(current_hash)
-            if blob is None:
-                broken_chains.append((game_id, current_hash))
-                break
-            
-            chain.append(blob)
-            current_hash = blob.parent_hash
-    
+    pf = store.packfile
+    if store.game_registry:
+        known = np.concatenate([
+            np.fromiter(pf.blob_order, dtype=np.uint64, count=len(pf)),
+            # Chain terminators: the init/orphan sentinels, and 0 for the
+            # init blob's own parent
+            np.array([0, ccamc.INIT_BLOB_HASH, ccamc.ORPHAN_PARENT_HASH],
+                     dtype=np.uint64),
+        ])
+        finals = np.fromiter(
+            (final_hash for final_hash, _ in store.game_registry.values()),
+            dtype=np.uint64, count=len(store.game_registry))
+        clean = (np.isin(pf.parent_hashes, known).all()
+                 and np.isin(finals, known).all())
+
+        if not clean:
+            # Locals for the chain walk: LOAD_FAST instead of repeated
+            # module/instance attribute lookups per blob
+            get_blob = pf.get_blob
+            init_hash = ccamc.INIT_BLOB_HASH
+            orphan_hash = ccamc.ORPHAN_PARENT_HASH
+            for game_id, (final_hash, meta_hash) in store.game_registry.items():
+                current_hash = final_hash
+                while current_hash != init_hash and current_hash != orphan_hash:
+                    blob = get_blob(current_hash)
+                    if blob is None:
+                        broken_chains.append((game_id, current_hash))
+                        break
+                    current_hash = blob.parent_hash
+
     if broken_chains:
         report(f"✗ Found {len(broken_chains)} broken blob chains:")
         for game_id, bad_hash in broken_chains[:5]:
@@ -534,6 +728,11 @@ def main():
     parser_import.add_argument('pgn_file', help='PGN file to import')
     parser_import.add_argument('--label', required=True, help='Source label')
     parser_import.add_argument('--quiet', action='store_true', help='Suppress progress output')
+    parser_import.add_argument('--jobs', '-j', type=int, default=1, metavar='<n>',
+                               help='Parse games in <n> worker processes (default: 1)')
+    parser_import.add_argument('--flush-bytes', type=int, default=64 * 1024 * 1024,
+                               metavar='<n>',
+                               help='Flush the store after <n> new arena bytes (default: 64 MiB)')
     
     # export
     parser_export = subparsers.add_parser('export', help='Export games from a source')
@@ -543,6 +742,8 @@ def main():
     # list
     parser_list = subparsers.add_parser('list', help='List entities')
     parser_list.add_argument('entity', choices=['sources'], help='Entity type to list')
+    parser_list.add_argument('--limit', type=int, metavar='<n>',
+                             help='Show only the first <n> sources')
     
     # show
     parser_show = subparsers.add_parser('show', help='Show details of a source')